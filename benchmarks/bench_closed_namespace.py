@@ -0,0 +1,86 @@
+"""Benchmark ClosedOntologyNamespace extraction against the SPARQL extraction path.
+
+Both paths extract the namespace mapping from an already parsed graph,
+i.e. parsing is not part of the timing.
+
+Run with:
+
+    uv run python benchmarks/bench_closed_namespace.py
+"""
+
+import timeit
+from types import MappingProxyType
+
+from rdflib import OWL, RDF, RDFS, Graph, Literal, Namespace, URIRef
+
+from lodkit import ClosedOntologyNamespace
+
+
+ex = Namespace("https://example.com/ontology#")
+
+_query = """
+prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+prefix owl: <http://www.w3.org/2002/07/owl#>
+
+select distinct ?name ?uri
+where {
+values ?type {
+  rdfs:Class
+  owl:Class
+
+  rdfs:Datatype
+
+  rdf:Property
+  owl:ObjectProperty
+  owl:DatatypeProperty
+  owl:AnnotationProperty
+
+  owl:NamedIndividual
+}
+
+?uri a ?type .
+filter (isIRI(?uri))
+
+bind (replace(str(?uri), "^.*[#/:]", "") AS ?name)
+filter (?name != "")
+}
+"""
+
+
+def sparql_mapping(graph: Graph) -> MappingProxyType[str, URIRef]:
+    """Reference implementation: SPARQL-based extraction prior to the direct index scan."""
+    return MappingProxyType(
+        {str(binding["name"]): binding["uri"] for binding in graph.query(_query)}  # type: ignore
+    )
+
+
+def make_graph(n: int = 20_000) -> Graph:
+    graph = Graph()
+    types = [OWL.Class, OWL.ObjectProperty, OWL.DatatypeProperty, OWL.NamedIndividual]
+
+    for i in range(n):
+        term = ex[f"term{i}"]
+        graph.add((term, RDF.type, types[i % len(types)]))
+        graph.add((term, RDFS.label, Literal(f"Term {i}", lang="en")))
+        graph.add((term, RDFS.comment, Literal(f"Definition of term {i}.")))
+
+    return graph
+
+
+def main(repeat: int = 3) -> None:
+    graph = make_graph()
+    assert ClosedOntologyNamespace(graph).mapping == sparql_mapping(graph)
+
+    print(f"{'extraction':<12}{'time [s]':>10}")
+
+    for name, extract in (
+        ("sparql", lambda: sparql_mapping(graph)),
+        ("index scan", lambda: ClosedOntologyNamespace(graph)),
+    ):
+        t = min(timeit.repeat(extract, number=1, repeat=repeat))
+        print(f"{name:<12}{t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
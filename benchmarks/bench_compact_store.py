@@ -0,0 +1,88 @@
+"""Benchmark resident graph memory of the CompactStore against rdflib's Memory store.
+
+Memory is measured with tracemalloc as the memory retained by the graph after to_graph,
+i.e. it includes the RDF term objects held by the store.
+
+Additionally, an add-if-absent loop measures lookups interleaved with single additions,
+which merge into the sorted permutations by binary search instead of re-sorting the store,
+and a Graph.set update loop measures single removals interleaved with additions and lookups.
+
+Run with:
+
+    uv run python benchmarks/bench_compact_store.py
+"""
+
+import gc
+import itertools
+import time
+import tracemalloc
+
+from rdflib import Graph, Literal, Namespace
+
+from lodkit import TripleChain, ttl
+
+
+ex = Namespace("https://example.com/")
+
+
+def triples():
+    for i in range(20_000):
+        yield from ttl(
+            ex[f"s{i}"],
+            (ex.p1, ex[f"o{i % 1_000}"]),
+            (ex.p2, str(i % 5_000)),
+            (ex.p3, ex[f"s{(i + 1) % 20_000}"]),
+            (ex.p4, ex.o),
+        )
+
+
+def add_if_absent(store: str, n: int = 5_000) -> float:
+    graph = Graph(store=store)
+    start = time.perf_counter()
+
+    for triple in itertools.islice(triples(), n):
+        if triple not in graph:
+            graph.add(triple)
+
+    return time.perf_counter() - start
+
+
+def update(store: str, n: int = 5_000) -> float:
+    graph = TripleChain(triples()).to_graph(store=store)
+    start = time.perf_counter()
+
+    for i in range(n):
+        graph.set((ex[f"s{i}"], ex.p2, Literal(i)))
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'store':<16}{'memory [MiB]':>14}{'bytes/triple':>14}{'time [s]':>10}")
+
+    for store in ("Memory", "LODKitCompact"):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+
+        graph = TripleChain(triples()).to_graph(store=store)
+        size = len(graph)
+
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{store:<16}{memory / 2**20:>14.1f}{memory / size:>14.0f}{elapsed:>10.3f}"
+        )
+        del graph
+
+    print(f"\n{'store':<16}{'add-if-absent [s]':>18}{'Graph.set [s]':>14}")
+
+    for store in ("Memory", "LODKitCompact"):
+        print(f"{store:<16}{add_if_absent(store):>18.3f}{update(store):>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
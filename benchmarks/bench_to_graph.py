@@ -0,0 +1,98 @@
+"""Benchmark batched to_graph insertion against a per-triple Graph.add loop.
+
+Insertion is timed for rdflib's default Memory store and the lodkit CompactStore and SQLiteStore,
+which implement a bulk Store.addN. The Memory store spends almost all of its time in Memory.add
+(addN is a per-triple loop), so batching and trusted=True gain next to nothing there;
+for the bulk loading stores, batching saves the per-triple store call (for SQLiteStore, a transaction per triple)
+and trusted=True additionally skips the per-batch term type checks.
+
+None of the timed insertions calls len on the graph, so CompactStore's deferred merge
+of added triples (on the first read) is excluded for all of them.
+
+Garbage collection stays enabled during timing, as it would for actual graph construction.
+
+Run with:
+
+    uv run python benchmarks/bench_to_graph.py
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+import tempfile
+import timeit
+
+from rdflib import Graph, Namespace
+
+from lodkit import CompactStore, SQLiteStore, TripleChain, ttl
+
+
+ex = Namespace("https://example.com/")
+
+triples = list(
+    ttl(ex.s, *[(ex[f"p{i % 50}"], ex[f"o{i}"], str(i)) for i in range(50_000)])
+)
+
+
+def memory_graph() -> Graph:
+    return Graph()
+
+
+def compact_graph() -> Graph:
+    return Graph(store=CompactStore())
+
+
+def sqlite_graph(directory: Path) -> Callable[[], Graph]:
+    def _sqlite_graph() -> Graph:
+        store = SQLiteStore()
+        store.destroy(directory / "graph.db")
+        store.open(directory / "graph.db", create=True)
+        return Graph(store=store)
+
+    return _sqlite_graph
+
+
+def add_loop(make_graph: Callable[[], Graph]) -> Graph:
+    """Reference implementation: the per-triple to_graph loop prior to batched insertion."""
+    graph = make_graph()
+    for triple in triples:
+        graph.add(triple)
+    return graph
+
+
+def to_graph(make_graph: Callable[[], Graph]) -> Graph:
+    return TripleChain(triples).to_graph(make_graph())
+
+
+def to_graph_trusted(make_graph: Callable[[], Graph]) -> Graph:
+    return TripleChain(triples).to_graph(make_graph(), trusted=True)
+
+
+def main(repeat: int = 3) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = {
+            "Memory": memory_graph,
+            "CompactStore": compact_graph,
+            "SQLiteStore": sqlite_graph(Path(tmp)),
+        }
+
+        print(f"{'store':<14}{'insertion':<20}{'time [s]':>10}{'triples/s':>14}")
+
+        for store, make_graph in stores.items():
+            for insert in (add_loop, to_graph, to_graph_trusted):
+                assert len(insert(make_graph)) == len(triples)
+
+                t = min(
+                    timeit.repeat(
+                        lambda: insert(make_graph),
+                        setup="import gc; gc.enable()",
+                        number=1,
+                        repeat=repeat,
+                    )
+                )
+                print(
+                    f"{store:<14}{insert.__name__:<20}{t:>10.3f}{len(triples) / t:>14,.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
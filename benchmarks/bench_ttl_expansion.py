@@ -0,0 +1,95 @@
+"""Benchmark ttl expansion against the former recursive implementation.
+
+Run with:
+
+    uv run python benchmarks/bench_ttl_expansion.py
+"""
+
+from collections.abc import Iterator
+import timeit
+
+from rdflib import RDF, BNode, Literal, Namespace, URIRef
+
+from lodkit import ttl
+from lodkit.types import Triple
+
+
+ex = Namespace("https://example.com/")
+
+
+class recursive_ttl(ttl):
+    """Reference implementation: the recursive ttl.__iter__ prior to the work stack engine."""
+
+    def __iter__(self) -> Iterator[Triple]:
+        for pred, *objs in self.predicate_object_pairs:
+            for obj in objs:
+                match obj:
+                    case ttl():
+                        yield (self.subject, pred, obj.subject)
+                        yield from obj
+                    case list():
+                        _b = BNode()
+                        yield (self.subject, pred, _b)
+                        yield from recursive_ttl(_b, *obj)
+                    case tuple():
+                        first, *rest = obj
+                        yield from recursive_ttl(
+                            self.subject,
+                            (
+                                pred,
+                                [
+                                    (RDF.first, first),
+                                    (RDF.rest, tuple(rest) or RDF.nil),
+                                ],
+                            ),
+                        )
+                    case obj if isinstance(obj, (URIRef, BNode, Literal)):
+                        yield (self.subject, pred, obj)
+                    case str():
+                        yield (self.subject, pred, Literal(obj))
+                    case _:
+                        raise TypeError
+
+
+def flat(cls):
+    return cls(ex.s, *[(ex[f"p{i}"], ex.o, "literal") for i in range(1_000)])
+
+
+def wide(cls):
+    return cls(
+        ex.s,
+        *[(ex.p, [(ex.p2, "1"), (ex.p3, ex.o, [(ex.p4, "2")])]) for _ in range(1_000)],
+    )
+
+
+def deep(cls):
+    obj: list = [(ex.p, "leaf")]
+    for _ in range(500):
+        obj = [(ex.p, obj)]
+    return cls(ex.s, (ex.p, obj))
+
+
+def collection(cls):
+    return cls(ex.s, (ex.p, tuple(map(str, range(300)))))
+
+
+def _best_of(func, number: int, repeat: int = 5) -> float:
+    """Return the best per-call time in milliseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1000
+
+
+def main(number: int = 10) -> None:
+    print(f"{'shape':<12}{'recursive [ms]':>16}{'work stack [ms]':>18}{'speedup':>10}")
+
+    for shape in (flat, wide, deep, collection):
+        old, new = shape(recursive_ttl), shape(ttl)
+        assert len(list(old)) == len(list(new))
+
+        t_old = _best_of(lambda: list(old), number)
+        t_new = _best_of(lambda: list(new), number)
+
+        print(f"{shape.__name__:<12}{t_old:>16.2f}{t_new:>18.2f}{t_old / t_new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark URIConstructor digest configurations.
+
+Compares minting throughput, URI component length and the size of serialized N-Triples
+for a graph with minted subject and object URIs.
+
+Run with:
+
+    uv run python benchmarks/bench_uri_constructor.py
+"""
+
+import io
+import timeit
+
+from rdflib import Namespace
+
+from lodkit import URIConstructor
+from lodkit.triple_tools.ntriples import serialize_stream
+
+
+ex = Namespace("https://example.com/")
+
+keys = [f"record/{i}" for i in range(100_000)]
+
+configurations: dict[str, dict] = {
+    "sha256 (default)": {},
+    "sha256 hex[:16]": {"length": 16},
+    "sha256 base64url": {"encoding": "base64url"},
+    "blake2b-16 hex": {"digest": "blake2b", "digest_size": 16},
+    "blake2b-8 base32": {"digest": "blake2b", "digest_size": 8, "encoding": "base32"},
+    "blake2s-16 base64url": {
+        "digest": "blake2s",
+        "digest_size": 16,
+        "encoding": "base64url",
+    },
+    "md5 hex": {"digest": "md5"},
+}
+
+
+def main(repeat: int = 5) -> None:
+    print(f"{'digest':<24}{'URIs/s':>12}{'component':>11}{'N-Triples [MiB]':>17}")
+
+    for name, kwargs in configurations.items():
+        make_uri = URIConstructor(ex, **kwargs)
+
+        t = min(
+            timeit.repeat(lambda: list(make_uri.many(keys)), number=1, repeat=repeat)
+        )
+
+        uris = list(make_uri.many(keys))
+        buffer = io.BytesIO()
+        serialize_stream(((uri, ex.p, o) for uri, o in zip(uris, uris[1:])), buffer)
+
+        component = len(uris[0]) - len(ex)
+        size = buffer.tell() / 2**20
+
+        print(f"{name:<24}{len(keys) / t:>12,.0f}{component:>11}{size:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,34 @@
 """Entry point for LODkit."""
 
+from lodkit.namespace_tools.codegen import (
+    generate_namespace_module,
+    write_namespace_module,
+)
+from lodkit.namespace_tools.namespace_registry import (
+    NamespaceConflicts,
+    NamespaceRegistry,
+    ResolvedURI,
+)
 from lodkit.namespace_tools.ontology_namespace import (
     ClosedOntologyNamespace,
     EmptySolutionException,
     NoSolutionException,
 )
 from lodkit.rdf_importer import RDFImporter, enable_rdf_import
+from lodkit.store_tools.compact_store import CompactStore
+from lodkit.store_tools.sqlite_store import SQLiteStore
+from lodkit.triple_tools.async_triple_chain import AsyncTripleChain
+from lodkit.triple_tools.literal_interning import (
+    disable_literal_interning,
+    enable_literal_interning,
+    literal_cache_info,
+)
+from lodkit.triple_tools.parallel_triple_chain import ParallelTripleChain
 from lodkit.triple_tools.triple_chain import TripleChain
 from lodkit.triple_tools.ttl_constructor import (
     TPredicateObjectPair,
     TPredicateObjectPairObject,
     ttl,
 )
+from lodkit.triple_tools.ttl_template import Placeholder, TTLTemplate
 from lodkit.uri_tools.uri_constructor import URIConstructor
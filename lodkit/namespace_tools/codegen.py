@@ -0,0 +1,197 @@
+"""LODKit ahead-of-time namespace module generation."""
+
+import argparse
+from collections.abc import Mapping, Sequence
+import json
+import keyword
+from pathlib import Path, PurePath
+
+from rdflib import Graph, URIRef
+
+from lodkit.namespace_tools.ontology_namespace import ClosedOntologyNamespace
+from lodkit.types import GraphParseSource
+
+# names bound in the generated class body and module globals referenced from it
+_RESERVED_NAMES = frozenset(
+    {"mapping", "_URIRef", "_MappingProxyType", "_Final", "_str"}
+)
+
+
+def generate_namespace_module(
+    source: GraphParseSource | Graph,
+    *parse_args,
+    class_name: str = "OntologyNamespace",
+    name: str = "namespace",
+    **parse_kwargs,
+) -> tuple[str, str]:
+    """Generate the source code of a static namespace module and its .pyi stub for an ontology source.
+
+    Namespace members are extracted like in ClosedOntologyNamespace. The generated module defines
+    a class class_name with a URIRef constant for every member name that is a valid Python identifier
+    and an instance of the class bound to name. Like ClosedOntologyNamespace, the instance supports
+    item lookup for all members (also for names that are not identifiers, e.g. "E52_Time-Span")
+    and exposes a read-only mapping of all members.
+
+    Returns a (module source, stub source) tuple.
+    Raises a ValueError if class_name or name are not valid (and distinct) Python identifiers.
+    """
+    for identifier in (class_name, name):
+        if not identifier.isidentifier() or keyword.iskeyword(identifier):
+            raise ValueError(
+                f"Unable to generate namespace module: '{identifier}' is not a valid Python identifier."
+            )
+    if class_name == name:
+        raise ValueError(
+            "Unable to generate namespace module: class_name and name must differ."
+        )
+
+    mapping = ClosedOntologyNamespace(source, *parse_args, **parse_kwargs).mapping
+    return (
+        _render_module(mapping, class_name, name, source),
+        _render_stub(mapping, class_name, name),
+    )
+
+
+def write_namespace_module(
+    source: GraphParseSource | Graph,
+    path: str | PurePath,
+    *parse_args,
+    class_name: str = "OntologyNamespace",
+    name: str = "namespace",
+    **parse_kwargs,
+) -> None:
+    """Write a static namespace module to path and its .pyi stub next to it.
+
+    See generate_namespace_module.
+    """
+    module, stub = generate_namespace_module(
+        source, *parse_args, class_name=class_name, name=name, **parse_kwargs
+    )
+    path = Path(path)
+
+    path.write_text(module)
+    path.with_suffix(".pyi").write_text(stub)
+
+
+def _attribute_names(mapping: Mapping[str, URIRef]) -> list[str]:
+    """Return the sorted member names that can be generated as class attributes."""
+    return sorted(
+        member
+        for member in mapping
+        if member.isidentifier()
+        and not keyword.iskeyword(member)
+        and not (member.startswith("__") and member.endswith("__"))
+        and member not in _RESERVED_NAMES
+    )
+
+
+def _string(value: str) -> str:
+    """Return a double-quoted Python string literal for value."""
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def _render_module(
+    mapping: Mapping[str, URIRef],
+    class_name: str,
+    name: str,
+    source: GraphParseSource | Graph,
+) -> str:
+    # escape the source label for the docstring, e.g. Windows paths or quotes
+    source_label = (
+        "an rdflib.Graph" if isinstance(source, Graph) else _string(source)[1:-1]
+    )
+    attributes = "".join(
+        f"    {member} = _URIRef({_string(mapping[member])})\n"
+        for member in _attribute_names(mapping)
+    )
+    items = "".join(
+        f"            {_string(member)}: _URIRef({_string(uri)}),\n"
+        for member, uri in sorted(mapping.items())
+    )
+
+    return f'''"""Static namespace module generated by lodkit from {source_label}.
+
+Do not edit; regenerate with lodkit.namespace_tools.codegen instead.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType as _MappingProxyType
+
+from rdflib import URIRef as _URIRef
+
+__all__ = ("{class_name}", "{name}")
+
+
+class {class_name}:
+    """Closed namespace of URIRef constants."""
+
+    __slots__ = ()
+
+{attributes}
+    mapping = _MappingProxyType(
+        {{
+{items}        }}
+    )
+
+    def __getitem__(self, key: str) -> _URIRef:
+        try:
+            return self.mapping[key]
+        except KeyError:
+            raise AttributeError(
+                f"'{{self.__class__.__name__}}' object has no attribute '{{key}}'."
+            ) from None
+
+    def __setattr__(self, key: str, value: object) -> None:
+        raise AttributeError(f"'{{self.__class__.__name__}}' object is read-only.")
+
+
+{name} = {class_name}()
+'''
+
+
+def _render_stub(mapping: Mapping[str, URIRef], class_name: str, name: str) -> str:
+    attributes = "".join(
+        f"    {member}: _Final[_URIRef]\n" for member in _attribute_names(mapping)
+    )
+
+    return f"""from builtins import str as _str
+from types import MappingProxyType as _MappingProxyType
+from typing import Final as _Final
+
+from rdflib import URIRef as _URIRef
+
+class {class_name}:
+    __slots__ = ()
+
+{attributes}    mapping: _Final[_MappingProxyType[_str, _URIRef]]
+
+    def __getitem__(self, key: _str) -> _URIRef: ...
+
+{name}: _Final[{class_name}]
+"""
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="lodkit-codegen",
+        description="Generate a static namespace module (and .pyi stub) from an ontology source.",
+    )
+    parser.add_argument("source", help="Ontology file path or URL.")
+    parser.add_argument("output", help="Path of the generated .py module.")
+    parser.add_argument("--format", help="RDF format of the source (default: guess).")
+    parser.add_argument("--class-name", default="OntologyNamespace")
+    parser.add_argument("--name", default="namespace")
+    args = parser.parse_args(argv)
+
+    write_namespace_module(
+        args.source,
+        args.output,
+        class_name=args.class_name,
+        name=args.name,
+        format=args.format,
+    )
+
+
+if __name__ == "__main__":
+    main()
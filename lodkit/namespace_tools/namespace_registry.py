@@ -0,0 +1,125 @@
+"""LODKit NamespaceRegistry functionality."""
+
+from collections.abc import Iterator, Mapping
+from typing import NamedTuple
+
+from rdflib import URIRef
+
+from lodkit.namespace_tools.ontology_namespace import ClosedOntologyNamespace
+
+type TRegistryNamespace = ClosedOntologyNamespace | Mapping[str, URIRef]
+
+
+class ResolvedURI(NamedTuple):
+    ontology: str
+    name: str
+
+
+class NamespaceConflicts(NamedTuple):
+    names: dict[str, tuple[str, ...]]
+    uris: dict[URIRef, tuple[ResolvedURI, ...]]
+
+
+class NamespaceRegistry:
+    """Merged registry of several ontology namespaces with a shared reverse index.
+
+    Namespaces are registered under an ontology key, either as ClosedOntologyNamespace objects
+    or as plain name -> URIRef mappings (e.g. ClosedOntologyNamespace.mapping).
+
+    NamespaceRegistry.resolve maps a URIRef back to an (ontology, name) pair and
+    NamespaceRegistry.contains checks URIRef membership across all registered namespaces;
+    both are a single dict lookup in a reverse index that is shared by all namespaces.
+
+    Like a mapping, the registry itself iterates over, indexes and tests membership of ontology keys,
+    i.e. `"crm" in registry` checks for a registered ontology, not for a URI.
+    The index references the URIRef and name objects of the registered mappings,
+    so it costs one dict entry per URI rather than a copy of every namespace.
+
+    If a URI is registered by several ontologies (or under several names),
+    the first registration is resolved; see NamespaceRegistry.conflicts for reporting
+    URIs registered more than once and names defined by more than one ontology.
+    """
+
+    def __init__(self, namespaces: Mapping[str, TRegistryNamespace] | None = None):
+        self._namespaces: dict[str, Mapping[str, URIRef]] = {}
+        self._index: dict[URIRef, ResolvedURI] = {}
+        self._uri_conflicts: dict[URIRef, list[ResolvedURI]] = {}
+
+        for ontology, namespace in (namespaces or {}).items():
+            self.register(ontology, namespace)
+
+    def register(self, ontology: str, namespace: TRegistryNamespace) -> None:
+        """Register a namespace under an ontology key and add its members to the reverse index.
+
+        Raises a ValueError if the ontology key is already registered.
+        """
+        if ontology in self._namespaces:
+            raise ValueError(f"Ontology '{ontology}' is already registered.")
+
+        mapping = (
+            namespace.mapping
+            if isinstance(namespace, ClosedOntologyNamespace)
+            else namespace
+        )
+        self._namespaces[ontology] = mapping
+
+        index = self._index
+        for name, uri in mapping.items():
+            resolved = ResolvedURI(ontology, name)
+
+            if (registered := index.setdefault(uri, resolved)) is not resolved:
+                self._uri_conflicts.setdefault(uri, [registered]).append(resolved)
+
+    def resolve(self, uri: URIRef) -> ResolvedURI:
+        """Return the (ontology, name) pair of a registered URIRef.
+
+        Raises a KeyError if uri is not registered.
+        """
+        try:
+            return self._index[uri]
+        except KeyError:
+            raise KeyError(f"URI '{uri}' is not registered in any namespace.") from None
+
+    def contains(self, uri: URIRef) -> bool:
+        """Check if uri is registered in any namespace."""
+        return uri in self._index
+
+    def get(self, uri: URIRef) -> ResolvedURI | None:
+        """Return the (ontology, name) pair of uri or None if uri is not registered."""
+        return self._index.get(uri)
+
+    def conflicts(self) -> NamespaceConflicts:
+        """Report names defined by more than one ontology and URIs registered more than once.
+
+        Name conflicts map a name to the keys of the ontologies that define the name;
+        URI conflicts map a URI to all its (ontology, name) registrations, in registration order.
+        """
+        name_ontologies: dict[str, list[str]] = {}
+
+        for ontology, mapping in self._namespaces.items():
+            for name in mapping:
+                name_ontologies.setdefault(name, []).append(ontology)
+
+        return NamespaceConflicts(
+            names={
+                name: tuple(ontologies)
+                for name, ontologies in name_ontologies.items()
+                if len(ontologies) > 1
+            },
+            uris={
+                uri: tuple(registrations)
+                for uri, registrations in self._uri_conflicts.items()
+            },
+        )
+
+    def __getitem__(self, ontology: str) -> Mapping[str, URIRef]:
+        return self._namespaces[ontology]
+
+    def __contains__(self, ontology: object) -> bool:
+        return ontology in self._namespaces
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._namespaces)
+
+    def __len__(self) -> int:
+        return len(self._namespaces)
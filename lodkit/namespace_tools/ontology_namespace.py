@@ -1,7 +1,14 @@
+import hashlib
+import json
+import os
+from pathlib import Path, PurePath
+import re
+import tempfile
+import threading
 from types import MappingProxyType
+from typing import Any
 
-from rdflib import Graph, URIRef
-from rdflib.query import Result
+from rdflib import OWL, RDF, RDFS, Graph, URIRef
 
 from lodkit.types import GraphParseSource
 
@@ -19,7 +26,7 @@ class ClosedOntologyNamespace:
     based on an Ontology or generally an RDF graph source.
 
     Given a lodkit.types.GraphParseSource or an rdflib.Graph,
-    the source is queried for RDF class and property definition assertions.
+    the source is scanned for RDF class and property definition assertions.
     RDF term names are extracted by splitting the last IRI segment delimited by
     '#', '/' or ':' and  matching name/IRI pairs are registered in the namespace mapping.
 
@@ -33,55 +40,62 @@ class ClosedOntologyNamespace:
     conflicting RDF terms are still accessible via item lookup
     or through the `ClosedOntologyNamespace.mapping` proxy.
 
-    """
-
-    _query = """
-    prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-    prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-    prefix owl: <http://www.w3.org/2002/07/owl#>
-
-    select distinct ?name ?uri
-    where {
-    values ?type {
-      rdfs:Class
-      owl:Class
-
-      rdfs:Datatype
-
-      rdf:Property
-      owl:ObjectProperty
-      owl:DatatypeProperty
-      owl:AnnotationProperty
+    If a cache_dir is given and the source is a local file, the extracted mapping
+    is cached in cache_dir; the cache key is derived from the resolved path, modification time
+    and size of the source file and the parse arguments, so warm starts skip both parsing and extraction.
 
-      owl:NamedIndividual
-    }
-
-    ?uri a ?type .
-    filter (isIRI(?uri))
-
-    bind (replace(str(?uri), "^.*[#/:]", "") AS ?name)
-    filter (?name != "")
-    }
+    If lazy is True, initialization returns immediately and the source is only parsed
+    (or loaded from the cache) on first access to a namespace member or the mapping;
+    concurrent first accesses parse the source only once.
+    Note that in lazy mode, a NoSolutionException is raised on first access.
     """
 
-    def __init__(self, source: GraphParseSource | Graph, *parse_args, **parse_kwargs):
+    _types: tuple[URIRef, ...] = (
+        RDFS.Class,
+        OWL.Class,
+        RDFS.Datatype,
+        RDF.Property,
+        OWL.ObjectProperty,
+        OWL.DatatypeProperty,
+        OWL.AnnotationProperty,
+        OWL.NamedIndividual,
+    )
+
+    def __init__(
+        self,
+        source: GraphParseSource | Graph,
+        *parse_args,
+        cache_dir: str | PurePath | None = None,
+        lazy: bool = False,
+        **parse_kwargs,
+    ):
         self.source = source
+        self.cache_dir = cache_dir
+        self._parse_args = parse_args
+        self._parse_kwargs = parse_kwargs
 
-        graph: Graph = (
-            self.source
-            if isinstance(self.source, Graph)
-            else Graph().parse(source=self.source, *parse_args, **parse_kwargs)
+        self._lock = threading.Lock()
+        self._mapping: MappingProxyType[str, URIRef] | None = (
+            None if lazy else self._build_mapping()
         )
-        sparql_result: Result = graph.query(self._query)
 
-        self.mapping: MappingProxyType[str, URIRef] = self._get_uris(
-            sparql_result=sparql_result
-        )
+    @property
+    def mapping(self) -> MappingProxyType[str, URIRef]:
+        if (mapping := self._mapping) is None:
+            with self._lock:
+                if (mapping := self._mapping) is None:
+                    mapping = self._mapping = self._build_mapping()
+
+        return mapping
 
     def __repr__(self) -> str:  # pragma: no cover
         return f"<{self.__class__.__name__} source={self.source!r}>"
 
     def __getattr__(self, value):
+        if "_mapping" not in vars(self):  # not initialized, e.g. during copying
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{value}'."
+            )
         return self[value]
 
     def __getitem__(self, key: str) -> URIRef:
@@ -92,18 +106,85 @@ class ClosedOntologyNamespace:
                 f"'{self.__class__.__name__}' object has no attribute '{key}'."
             )
 
-    def _get_uris(self, sparql_result: Result) -> MappingProxyType[str, URIRef]:
-        _bindings = sparql_result.bindings
+    def _build_mapping(self) -> MappingProxyType[str, URIRef]:
+        """Parse the source and extract the namespace mapping or load it from the cache."""
+        cache_path = self._cache_path()
 
-        match _bindings:
-            case []:
-                raise NoSolutionException()
-            case [{**items}] if not items:  # pragma: no cover (unreachable)
-                raise EmptySolutionException()
-            case _:
+        if cache_path is not None and cache_path.is_file():
+            with open(cache_path) as f:
                 return MappingProxyType(
-                    {
-                        str(binding["name"]): binding["uri"]  # type: ignore
-                        for binding in _bindings
-                    }
+                    {name: URIRef(uri) for name, uri in json.load(f).items()}
                 )
+
+        graph: Graph = (
+            self.source
+            if isinstance(self.source, Graph)
+            else Graph().parse(self.source, *self._parse_args, **self._parse_kwargs)
+        )
+        mapping = self._get_uris(graph=graph)
+
+        if cache_path is not None:
+            _write_atomic(cache_path, mapping)
+
+        return mapping
+
+    def _cache_path(self) -> Path | None:
+        """Return the cache file path for the source or None if the source is not cacheable."""
+        if self.cache_dir is None or not isinstance(self.source, (str, PurePath)):
+            return None
+
+        path = Path(self.source)
+        if not path.is_file():
+            return None
+
+        stat = path.stat()
+        key = json.dumps(
+            [
+                str(path.resolve()),
+                stat.st_mtime_ns,
+                stat.st_size,
+                repr(self._parse_args),
+                repr(sorted(self._parse_kwargs.items())),
+                [str(_type) for _type in self._types],
+            ]
+        )
+
+        return Path(self.cache_dir, f"{hashlib.sha256(key.encode()).hexdigest()}.json")
+
+    def _get_uris(self, graph: Graph) -> MappingProxyType[str, URIRef]:
+        """Extract name/IRI pairs for all IRI subjects of the definition types in _types.
+
+        Subjects are looked up directly via the graph's (predicate, object) index
+        instead of evaluating a SPARQL query.
+        """
+        mapping: dict[str, URIRef] = {}
+
+        for _type in self._types:
+            for uri in graph.subjects(RDF.type, _type):
+                if isinstance(uri, URIRef) and (name := _split_name(uri)):
+                    mapping[name] = uri
+
+        if not mapping:
+            raise NoSolutionException()
+
+        return MappingProxyType(mapping)
+
+
+def _write_atomic(path: Path, mapping: Any) -> None:
+    """Write mapping as JSON to path; the file is replaced atomically, so readers never see partial caches."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, suffix=".tmp", delete=False
+    ) as f:
+        json.dump(dict(mapping), f, separators=(",", ":"))
+
+    os.replace(f.name, path)
+
+
+_NAME_DELIMITER_PATTERN: re.Pattern[str] = re.compile(r"^.*[#/:]")
+
+
+def _split_name(uri: URIRef) -> str:
+    """Extract the term name of an IRI, i.e. the last IRI segment delimited by '#', '/' or ':'."""
+    return _NAME_DELIMITER_PATTERN.sub("", uri, count=1)
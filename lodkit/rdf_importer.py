@@ -18,8 +18,14 @@ class RDFImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
     one can do "from graph import my_graph" if RDFImporter is register
     (e.g. by calling enable_rdf_import()); this will parse my_graph.ttl
     and bind my_graph to the resulting rdflib.Graph instance.
+
+    Imported graphs use a new instance of the rdflib store plugin store,
+    e.g. RDFImporter(store="LODKitCompact") for memory-efficient graphs.
     """
 
+    def __init__(self, store: str = "default") -> None:
+        self.store = store
+
     def find_spec(
         self,
         fullname: str,
@@ -59,7 +65,7 @@ class RDFImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
 
         The method relies on the finder to register the Path of an RDF resource in the importer instance.
         """
-        graph = Graph()
+        graph = Graph(store=self.store)
         graph.parse(str(self.rdf_resource.absolute()))
 
         return graph
@@ -76,8 +82,14 @@ class RDFImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
         pass
 
 
-def enable_rdf_import() -> None:
-    """Invoke the module-level side effect of adding an RDFImporter instance to sys.meta_path."""
+def enable_rdf_import(store: str = "default") -> None:
+    """Invoke the module-level side effect of adding an RDFImporter instance to sys.meta_path.
+
+    If an RDFImporter is already registered, its store plugin is set to store.
+    """
+    for entry in sys.meta_path:
+        if isinstance(entry, RDFImporter):
+            entry.store = store
+            return
 
-    if not any(isinstance(entry, RDFImporter) for entry in sys.meta_path):
-        sys.meta_path.append(RDFImporter())
+    sys.meta_path.append(RDFImporter(store=store))
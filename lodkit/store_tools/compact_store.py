@@ -0,0 +1,340 @@
+"""LODKit compact in-memory store plugin for rdflib."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+import itertools
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from typing import Any, Literal as TLiteral
+
+from rdflib import URIRef, plugin
+from rdflib.graph import Graph
+from rdflib.store import Store
+from rdflib.term import Node
+
+from lodkit.types import Triple
+
+type _TriplePattern = tuple[Node | None, Node | None, Node | None]
+type _Order = TLiteral["spo", "pos", "osp"]
+
+
+class CompactStore(Store):
+    """Memory-efficient rdflib store with dictionary-encoded terms and array-backed triples.
+
+    Every RDF term is interned once and assigned an integer id;
+    triples are kept as three array('Q') id columns in insertion order,
+    SPO, POS and OSP pattern lookups binary search sorted array('Q') permutations of row positions;
+    the SPO permutation is always maintained, POS and OSP permutations are built lazily
+    on the first lookup that needs them and maintained from then on.
+
+    Added triples are appended to pending arrays and merged into the columns and permutations
+    on the next read: a few pending triples are inserted into the permutations by binary search,
+    larger batches are sorted and merged with the permutations in linear time.
+    Interleaving single additions and lookups (e.g. `if triple not in graph: graph.add(triple)`)
+    therefore costs a binary search and an array insertion per addition, not a re-sort of the store.
+
+    Removed triples are marked as deleted and skipped by lookups; deleted rows are purged from
+    the columns and permutations at once when they make up more than a quarter of the store,
+    so single removals (e.g. in Graph.set) cost a lookup, not a rebuild of the store.
+
+    The store is not context-aware and is registered as rdflib store plugin "LODKitCompact",
+    e.g. Graph(store="LODKitCompact") or triple_chain.to_graph(store="LODKitCompact").
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(
+        self, configuration: str | None = None, identifier: Node | None = None
+    ) -> None:
+        super().__init__(configuration, identifier)
+        self.identifier = identifier
+
+        self._terms: list[Node] = []
+        self._ids: dict[Node, int] = {}
+
+        self._columns: tuple[array, array, array] = _columns()
+        self._pending: tuple[array, array, array] = _columns()
+        self._permutations: dict[_Order, array] = {"spo": array("Q")}
+        self._removed: set[int] = set()
+
+        self._namespace: dict[str, URIRef] = {}
+        self._prefix: dict[URIRef, str] = {}
+
+    def add(self, triple: Triple, context: Any = None, quoted: bool = False) -> None:
+        self.addN([(*triple, context)])
+
+    def addN(self, quads: Iterable[tuple[Node, Node, Node, Any]]) -> None:  # noqa: N802
+        """Intern the terms of quads (contexts are ignored) and append the triples to the pending arrays."""
+        ids, terms = self._ids, self._terms
+        pending_s, pending_p, pending_o = self._pending
+
+        def _intern(term: Node) -> int:
+            if (term_id := ids.get(term)) is None:
+                term_id = ids[term] = len(terms)
+                terms.append(term)
+            return term_id
+
+        for s, p, o, _ in quads:
+            pending_s.append(_intern(s))
+            pending_p.append(_intern(p))
+            pending_o.append(_intern(o))
+
+    def remove(self, triple_pattern: _TriplePattern, context: Any = None) -> None:
+        if rows := self._rows(triple_pattern):
+            self._removed.update(rows)
+
+    def triples(
+        self, triple_pattern: _TriplePattern, context: Any = None
+    ) -> Iterator[tuple[Triple, Iterator[Any]]]:
+        if (rows := self._rows(triple_pattern)) is None:
+            return
+
+        terms = self._terms
+        s, p, o = self._columns
+
+        for row in rows:
+            yield (terms[s[row]], terms[p[row]], terms[o[row]]), iter(())  # type: ignore[misc]
+
+    def __len__(self, context: Any = None) -> int:
+        self._compact()
+        return len(self._columns[0]) - len(self._removed)
+
+    def contexts(self, triple: Triple | None = None) -> Generator[Graph, None, None]:
+        yield from ()
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        bound_namespace = self._namespace.get(prefix)
+        bound_prefix = self._prefix.get(namespace)
+
+        if not override and (bound_namespace is not None or bound_prefix is not None):
+            return
+
+        self._prefix.pop(bound_namespace, None)  # type: ignore[arg-type]
+        self._namespace.pop(bound_prefix, None)  # type: ignore[arg-type]
+        self._namespace[prefix] = namespace
+        self._prefix[namespace] = prefix
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        return self._namespace.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        return self._prefix.get(namespace)
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        yield from list(self._namespace.items())
+
+    def _compact(self) -> None:
+        """Merge pending triples into the columns and the sorted permutations and purge removed rows.
+
+        New triples are appended to the columns, so row positions of stored triples stay valid;
+        triples that are already stored (or pending more than once) are skipped,
+        adding a removed triple again unmarks its row.
+        """
+        if (pending := self._pending)[0]:
+            self._pending = _columns()
+
+            if len(pending[0]) * 32 <= len(self._columns[0]):
+                self._insert(*pending)
+            else:
+                self._merge(*pending)
+
+        if len(self._removed) * 4 > len(self._columns[0]):
+            self._purge()
+
+    def _purge(self) -> None:
+        """Drop removed rows from the columns and permutations and renumber the remaining rows."""
+        removed = self._removed
+        remap = array("Q", [0]) * len(self._columns[0])
+        kept = array("Q")
+
+        for row in range(len(remap)):
+            if row not in removed:
+                remap[row] = len(kept)
+                kept.append(row)
+
+        self._columns = tuple(  # type: ignore[assignment]
+            array("Q", map(column.__getitem__, kept)) for column in self._columns
+        )
+        self._permutations = {
+            order: array("Q", (remap[row] for row in permutation if row not in removed))
+            for order, permutation in self._permutations.items()
+        }
+        self._removed = set()
+
+    def _insert(self, pending_s: array, pending_p: array, pending_o: array) -> None:
+        """Insert a few pending triples into the permutations by binary search."""
+        s, p, o = self._columns
+        spo = self._permutations["spo"]
+        spo_key = self._key("spo")
+        other_keys = [
+            (permutation, self._key(order))
+            for order, permutation in self._permutations.items()
+            if order != "spo"
+        ]
+
+        for triple in zip(pending_s, pending_p, pending_o):
+            packed = _pack(*triple)
+            position = bisect_left(spo, packed, key=spo_key)
+
+            if position < len(spo) and spo_key(spo[position]) == packed:
+                self._removed.discard(spo[position])
+                continue
+
+            row = len(s)
+            s.append(triple[0])
+            p.append(triple[1])
+            o.append(triple[2])
+
+            spo.insert(position, row)
+            for permutation, key in other_keys:
+                permutation.insert(bisect_right(permutation, key(row), key=key), row)
+
+    def _merge(self, pending_s: array, pending_p: array, pending_o: array) -> None:
+        """Sort pending triples and merge them with the permutations in linear time.
+
+        The existing permutation and the sorted new rows are two sorted runs,
+        which sorted (Timsort) merges with a linear number of comparisons.
+        """
+        columns = self._columns
+        stored = len(columns[0])
+
+        for column, pending in zip(columns, (pending_s, pending_p, pending_o)):
+            column.extend(pending)
+
+        spo_key = self._key("spo")
+        merged = sorted(
+            itertools.chain(
+                self._permutations["spo"],
+                sorted(range(stored, len(columns[0])), key=spo_key),
+            ),
+            key=spo_key,
+        )
+
+        # stable sorting keeps stored rows before new duplicates
+        spo = array("Q")
+        new_rows = array("Q")
+        removed = self._removed
+        previous = None
+
+        for row in merged:
+            if (packed := spo_key(row)) == previous:
+                removed.discard(spo[-1])
+                continue
+            previous = packed
+
+            if row >= stored:
+                new_rows.append(row)
+                row = stored + len(new_rows) - 1
+            spo.append(row)
+
+        # rewrite the appended rows without duplicates (in SPO order)
+        for column in columns:
+            tail = array("Q", map(column.__getitem__, new_rows))
+            del column[stored:]
+            column.extend(tail)
+
+        self._permutations["spo"] = spo
+
+        for order, permutation in self._permutations.items():
+            if order == "spo":
+                continue
+            key = self._key(order)
+            self._permutations[order] = array(
+                "Q",
+                sorted(
+                    itertools.chain(
+                        permutation, sorted(range(stored, len(columns[0])), key=key)
+                    ),
+                    key=key,
+                ),
+            )
+
+    def _permutation(self, order: _Order) -> Sequence[int]:
+        """Return (and lazily build) the row positions sorted in the given order."""
+        if (permutation := self._permutations.get(order)) is None:
+            permutation = self._permutations[order] = array(
+                "Q", sorted(range(len(self._columns[0])), key=self._key(order))
+            )
+
+        return permutation
+
+    def _key(self, order: _Order) -> Callable[[int], int]:
+        """Return a function that packs the term ids of a row in the given order into a sort key."""
+        first, second, third = self._order_columns(order)
+        return lambda row: _pack(first[row], second[row], third[row])
+
+    def _order_columns(self, order: _Order) -> tuple[array, array, array]:
+        s, p, o = self._columns
+        return {"spo": (s, p, o), "pos": (p, o, s), "osp": (o, s, p)}[order]
+
+    def _rows(self, triple_pattern: _TriplePattern) -> Sequence[int] | None:
+        """Return the row positions matching a triple pattern, skipping removed rows.
+
+        Returns None if a bound term of the pattern is not interned,
+        i.e. if no triple can match the pattern.
+        """
+        self._compact()
+
+        s, p, o = (
+            None if term is None else self._ids.get(term) for term in triple_pattern
+        )
+        if any(
+            term is not None and term_id is None
+            for term, term_id in zip(triple_pattern, (s, p, o))
+        ):
+            return None
+
+        match s, p, o:
+            case None, None, None:
+                rows = self._permutation("spo")
+            case _, None, _ if s is not None and o is not None:
+                rows = self._range("osp", (o, s))
+            case _ if s is not None:
+                rows = self._range("spo", _prefix(s, p, o))
+            case _ if p is not None:
+                rows = self._range("pos", _prefix(p, o))
+            case _:
+                rows = self._range("osp", (o,))
+
+        if self._removed:
+            return array("Q", itertools.filterfalse(self._removed.__contains__, rows))
+        return rows
+
+    def _range(self, order: _Order, prefix: tuple[int, ...]) -> Sequence[int]:
+        """Binary search the rows whose leading columns in the given order equal prefix."""
+        permutation = self._permutation(order)
+        columns = self._order_columns(order)[: len(prefix)]
+
+        key: Callable[[int], tuple[int, ...]] = lambda row: tuple(  # noqa: E731
+            column[row] for column in columns
+        )
+
+        start = bisect_left(permutation, prefix, key=key)
+        stop = bisect_right(permutation, prefix, lo=start, key=key)
+
+        return permutation[start:stop]
+
+
+def _columns() -> tuple[array, array, array]:
+    return array("Q"), array("Q"), array("Q")
+
+
+def _pack(first: int, second: int, third: int) -> int:
+    return (first << 128) | (second << 64) | third
+
+
+def _prefix(*term_ids: int | None) -> tuple[int, ...]:
+    """Return the leading bound term ids of a pattern in index order."""
+    prefix: list[int] = []
+
+    for term_id in term_ids:
+        if term_id is None:
+            break
+        prefix.append(term_id)
+
+    return tuple(prefix)
+
+
+plugin.register("LODKitCompact", Store, __name__, CompactStore.__name__)
@@ -0,0 +1,305 @@
+"""LODKit SQLite store plugin for rdflib."""
+
+from collections.abc import Generator, Iterable, Iterator
+import os
+from pathlib import PurePath
+import sqlite3
+from typing import Any
+
+from rdflib import BNode, Literal, URIRef, plugin
+from rdflib.graph import Graph
+from rdflib.store import NO_STORE, VALID_STORE, Store
+from rdflib.term import Node
+
+from lodkit.types import Triple
+
+type _TermKey = tuple[str, str, str, str]
+type _TriplePattern = tuple[Node | None, Node | None, Node | None]
+
+SQLITE_URL_PREFIX = "sqlite:///"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    lexical TEXT NOT NULL,
+    datatype TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    UNIQUE (kind, lexical, datatype, lang)
+);
+CREATE TABLE IF NOT EXISTS triples (
+    s INTEGER NOT NULL,
+    p INTEGER NOT NULL,
+    o INTEGER NOT NULL,
+    PRIMARY KEY (s, p, o)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS triples_pos ON triples (p, o, s);
+CREATE INDEX IF NOT EXISTS triples_osp ON triples (o, s, p);
+CREATE TABLE IF NOT EXISTS namespaces (
+    prefix TEXT PRIMARY KEY,
+    uri TEXT NOT NULL UNIQUE
+);
+"""
+
+_SELECT_TRIPLES = """
+SELECT
+    s.kind, s.lexical, s.datatype, s.lang,
+    p.kind, p.lexical, p.datatype, p.lang,
+    o.kind, o.lexical, o.datatype, o.lang
+FROM triples AS t
+JOIN terms AS s ON s.id = t.s
+JOIN terms AS p ON p.id = t.p
+JOIN terms AS o ON o.id = t.o
+"""
+
+
+class SQLiteStore(Store):
+    """Persistent rdflib store backed by a local SQLite database.
+
+    RDF terms are dictionary-encoded into a terms table, triples are stored as integer id triples
+    in a WITHOUT ROWID table keyed on (s, p, o) with additional covering (p, o, s) and (o, s, p) indexes,
+    so every triple pattern is answered from an index.
+
+    Store.addN inserts a whole batch of triples in a single transaction;
+    term ids are cached in a bounded cache of cache_size entries.
+
+    The store is not context-aware, i.e. it holds a single graph per database file.
+    The store is registered as rdflib store plugin "LODKitSQLite", e.g.
+
+        graph = Graph(store="LODKitSQLite")
+        graph.open("graph.db", create=True)
+
+    or equivalently Graph(store=SQLiteStore("graph.db")) for an existing database.
+    Connections are not bound to the creating thread, but the store must not be used concurrently.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(
+        self,
+        configuration: str | PurePath | None = None,
+        identifier: Node | None = None,
+        cache_size: int = 2**16,
+    ) -> None:
+        self.identifier = identifier
+        self.cache_size = cache_size
+        self._connection: sqlite3.Connection | None = None
+        self._term_ids: dict[Node, int] = {}
+
+        super().__init__(
+            None if configuration is None else os.fspath(configuration), identifier
+        )
+
+    def open(self, configuration: str | PurePath, create: bool = False) -> int:
+        """Open the SQLite database at configuration (a path or a sqlite:/// URL).
+
+        If create is False and the database does not exist, rdflib.store.NO_STORE is returned.
+        """
+        path = _sqlite_path(configuration)
+
+        if not create and path != ":memory:" and not os.path.exists(path):
+            return NO_STORE
+
+        self.close()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            "PRAGMA journal_mode = WAL; PRAGMA synchronous = NORMAL;" + _SCHEMA
+        )
+
+        return VALID_STORE
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+        self._term_ids.clear()
+
+    def destroy(self, configuration: str | PurePath) -> None:
+        self.close()
+        path = _sqlite_path(configuration)
+
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise RuntimeError(
+                "SQLiteStore is not open. Call open(configuration, create=True) first."
+            )
+        return self._connection
+
+    def add(self, triple: Triple, context: Any = None, quoted: bool = False) -> None:
+        self.addN([(*triple, context)])
+
+    def addN(self, quads: Iterable[tuple[Node, Node, Node, Any]]) -> None:  # noqa: N802
+        """Insert quads (contexts are ignored) in a single transaction."""
+        term_id = self._term_id
+
+        try:
+            with self.connection as connection:
+                connection.executemany(
+                    "INSERT OR IGNORE INTO triples (s, p, o) VALUES (?, ?, ?)",
+                    [(term_id(s), term_id(p), term_id(o)) for s, p, o, _ in quads],
+                )
+        except BaseException:
+            # term ids inserted in the rolled back transaction are invalid
+            self._term_ids.clear()
+            raise
+
+    def remove(self, triple_pattern: _TriplePattern, context: Any = None) -> None:
+        if (where := self._where(triple_pattern)) is None:
+            return
+
+        clause, parameters = where
+        with self.connection as connection:
+            connection.execute(f"DELETE FROM triples AS t {clause}", parameters)
+
+    def triples(
+        self, triple_pattern: _TriplePattern, context: Any = None
+    ) -> Iterator[tuple[Triple, Iterator[Any]]]:
+        if (where := self._where(triple_pattern)) is None:
+            return
+
+        clause, parameters = where
+        for row in self.connection.execute(_SELECT_TRIPLES + clause, parameters):
+            triple = (
+                _decode_term(*row[0:4]),
+                _decode_term(*row[4:8]),
+                _decode_term(*row[8:12]),
+            )
+            yield triple, iter(())  # type: ignore[misc]
+
+    def __len__(self, context: Any = None) -> int:
+        (count,) = self.connection.execute("SELECT COUNT(*) FROM triples").fetchone()
+        return count
+
+    def contexts(self, triple: Triple | None = None) -> Generator[Graph, None, None]:
+        yield from ()
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        with self.connection as connection:
+            if override:
+                connection.execute(
+                    "DELETE FROM namespaces WHERE prefix = ? OR uri = ?",
+                    (prefix, str(namespace)),
+                )
+            connection.execute(
+                "INSERT OR IGNORE INTO namespaces (prefix, uri) VALUES (?, ?)",
+                (prefix, str(namespace)),
+            )
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        row = self.connection.execute(
+            "SELECT uri FROM namespaces WHERE prefix = ?", (prefix,)
+        ).fetchone()
+        return None if row is None else URIRef(row[0])
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        row = self.connection.execute(
+            "SELECT prefix FROM namespaces WHERE uri = ?", (str(namespace),)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        for prefix, uri in self.connection.execute(
+            "SELECT prefix, uri FROM namespaces"
+        ).fetchall():
+            yield prefix, URIRef(uri)
+
+    def _term_id(self, term: Node) -> int:
+        """Return the id of term, inserting term into the terms table if necessary."""
+        if (cached := self._term_ids.get(term)) is not None:
+            return cached
+
+        (term_id,) = self.connection.execute(
+            "INSERT INTO terms (kind, lexical, datatype, lang) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT DO UPDATE SET kind = excluded.kind RETURNING id",
+            _encode_term(term),
+        ).fetchone()
+
+        self._cache(term, term_id)
+        return term_id
+
+    def _lookup(self, term: Node) -> int | None:
+        """Return the id of term or None if term is not in the terms table."""
+        if (cached := self._term_ids.get(term)) is not None:
+            return cached
+
+        row = self.connection.execute(
+            "SELECT id FROM terms "
+            "WHERE kind = ? AND lexical = ? AND datatype = ? AND lang = ?",
+            _encode_term(term),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        self._cache(term, row[0])
+        return row[0]
+
+    def _cache(self, term: Node, term_id: int) -> None:
+        if len(self._term_ids) >= self.cache_size:
+            self._term_ids.clear()
+        self._term_ids[term] = term_id
+
+    def _where(self, triple_pattern: _TriplePattern) -> tuple[str, list[int]] | None:
+        """Compile a triple pattern into a WHERE clause over term ids.
+
+        Returns None if a bound term of the pattern is not in the store,
+        i.e. if no triple can match the pattern.
+        """
+        conditions: list[str] = []
+        parameters: list[int] = []
+
+        for column, term in zip(("s", "p", "o"), triple_pattern):
+            if term is None:
+                continue
+            if (term_id := self._lookup(term)) is None:
+                return None
+            conditions.append(f"t.{column} = ?")
+            parameters.append(term_id)
+
+        clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return clause, parameters
+
+
+def _sqlite_path(configuration: str | PurePath) -> str:
+    return os.fspath(configuration).removeprefix(SQLITE_URL_PREFIX)
+
+
+def _encode_term(term: Node) -> _TermKey:
+    match term:
+        case URIRef():
+            return ("U", str(term), "", "")
+        case BNode():
+            return ("B", str(term), "", "")
+        case Literal():
+            return ("L", str(term), str(term.datatype or ""), term.language or "")
+        case _:
+            raise TypeError(
+                f"Unable to store term '{term}'. "
+                "SQLiteStore only supports rdflib.URIRef, rdflib.BNode and rdflib.Literal terms."
+            )
+
+
+def _decode_term(kind: str, lexical: str, datatype: str, lang: str) -> Node:
+    match kind:
+        case "U":
+            return URIRef(lexical)
+        case "B":
+            return BNode(lexical)
+        case _:
+            return Literal(
+                lexical,
+                lang=lang or None,
+                datatype=URIRef(datatype) if datatype else None,
+            )
+
+
+plugin.register("LODKitSQLite", Store, __name__, SQLiteStore.__name__)
@@ -0,0 +1,139 @@
+"""LODKit asynchronous TripleChain."""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from pathlib import PurePath
+from typing import IO, Self
+import warnings
+
+from rdflib import BNode, Graph, URIRef
+from rdflib.store import Store
+
+from lodkit.triple_tools.ntriples import NTriplesWriter
+from lodkit.triple_tools.utils import _add_triples, _resolve_graph
+from lodkit.types import Triple
+
+
+class AsyncTripleChain(AsyncIterator[Triple]):
+    """Asynchronous chain for chaining sync and async lodkit._Triple iterables.
+
+    AsyncTripleChain accepts both Iterable[Triple] and AsyncIterable[Triple] objects
+    and implements the same fluid chain interface as TripleChain.
+
+    The to_graph and to_file sinks are coroutines; triples are consumed in batches
+    and every batch is inserted/written in a worker thread while the next batch is collected,
+    so triple generation and ingestion overlap with graph insertion and file I/O.
+    Note that awaiting to_graph or to_file exhausts the AsyncTripleChain object.
+    """
+
+    def __init__(self, *iterables: Iterable[Triple] | AsyncIterable[Triple]) -> None:
+        self._iterator: AsyncIterator[Triple] = _achain(iterables)
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> Triple:
+        return await anext(self._iterator)
+
+    def chain(self, *others: Iterable[Triple] | AsyncIterable[Triple]) -> Self:
+        return self.__class__(self, *others)
+
+    async def to_graph(
+        self,
+        graph: Graph | None = None,
+        batch_size: int = 10_000,
+        trusted: bool = False,
+        store: Store | str | None = None,
+    ) -> Graph:
+        _graph: Graph = _resolve_graph(graph, store)
+
+        def _add(batch: list[Triple]) -> None:
+            _add_triples(_graph, batch, batch_size, trusted)
+
+        # only count the graph if nothing was added, len is a full scan for some stores
+        if not await _consume_batches(self, _add, batch_size) and not _graph:
+            msg = f"Graph object '{_graph}' is empty. This might indicate an exhausted iterator."
+            warnings.warn(msg)
+
+        return _graph
+
+    async def to_file(
+        self,
+        destination: IO[bytes] | str | PurePath,
+        graph_name: URIRef | BNode | None = None,
+        batch_size: int = 10_000,
+    ) -> int:
+        if isinstance(destination, (str, PurePath)):
+            with open(destination, "wb") as f:
+                return await self.to_file(f, graph_name, batch_size)
+
+        with NTriplesWriter(destination, graph_name, batch_size) as writer:
+            count = await _consume_batches(self, writer.write, batch_size)
+
+        if not count:
+            msg = f"No triples written to '{destination}'. This might indicate an exhausted iterator."
+            warnings.warn(msg)
+
+        return count
+
+
+async def _achain(
+    iterables: Iterable[Iterable[Triple] | AsyncIterable[Triple]],
+) -> AsyncIterator[Triple]:
+    for iterable in iterables:
+        if isinstance(iterable, AsyncIterable):
+            async for triple in iterable:
+                yield triple
+        else:
+            for triple in iterable:
+                yield triple
+
+
+async def _consume_batches(
+    triples: AsyncIterable[Triple],
+    consume: Callable[[list[Triple]], object],
+    batch_size: int,
+) -> int:
+    """Collect triples in batches and pass every batch to consume in a worker thread.
+
+    At most one batch is consumed at any time, so consume does not need to be thread-safe;
+    the next batch is collected concurrently.
+    If collecting fails (or the task is cancelled), the outstanding batch is still
+    awaited before the exception propagates, so consume never outlives the call.
+    Returns the total number of consumed triples.
+    """
+    count = 0
+    batch: list[Triple] = []
+    pending: asyncio.Future | None = None
+
+    async def _flush() -> None:
+        nonlocal batch, count, pending
+
+        if pending is not None:
+            await pending
+
+        pending = asyncio.ensure_future(asyncio.to_thread(consume, batch))
+        count += len(batch)
+        batch = []
+
+    try:
+        async for triple in triples:
+            batch.append(triple)
+
+            if len(batch) >= batch_size:
+                await _flush()
+
+        if batch:
+            await _flush()
+    except BaseException:
+        # worker threads cannot be interrupted; wait for the running batch
+        if pending is not None:
+            await asyncio.wait([pending])
+            if not pending.cancelled():
+                pending.exception()  # mark as retrieved, the original exception propagates
+        raise
+
+    if pending is not None:
+        await pending
+
+    return count
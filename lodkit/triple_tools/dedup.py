@@ -0,0 +1,108 @@
+"""LODKit streaming triple deduplication."""
+
+from collections.abc import Iterable, Iterator
+from hashlib import blake2b
+import math
+from typing import Literal as TLiteral
+
+from lodkit.triple_tools.ntriples import _nt_term
+from lodkit.types import Triple
+
+type TUniqueMode = TLiteral["exact", "approximate"]
+
+
+class BloomFilter:
+    """Bloom filter over byte strings.
+
+    The filter is sized for capacity items at the given false positive rate;
+    bits are stored in a bytearray and k bit positions per item are derived
+    from a 128-bit blake2b digest using double hashing.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be in the open interval (0, 1).")
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer.")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        self.size: int = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count: int = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, item: bytes) -> bool:
+        """Add an item and return True if the item was (probably) already present."""
+        digest = blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8])
+        h2 = int.from_bytes(digest[8:]) | 1
+
+        bits, size = self._bits, self.size
+        present = True
+
+        for i in range(self.hash_count):
+            index = (h1 + i * h2) % size
+            byte, mask = index >> 3, 1 << (index & 7)
+
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                present = False
+
+        return present
+
+    def __contains__(self, item: bytes) -> bool:
+        digest = blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8])
+        h2 = int.from_bytes(digest[8:]) | 1
+
+        return all(
+            self._bits[index >> 3] & (1 << (index & 7))
+            for index in ((h1 + i * h2) % self.size for i in range(self.hash_count))
+        )
+
+
+def unique(
+    triples: Iterable[Triple],
+    mode: TUniqueMode = "exact",
+    capacity: int = 10_000_000,
+    error_rate: float = 1e-6,
+) -> Iterator[Triple]:
+    """Remove duplicate triples from a triple stream in a single pass.
+
+    Triples are identified by their N-Triples encoding; only fingerprints are retained,
+    never the triple terms themselves.
+
+    - exact: 128-bit blake2b fingerprints are kept in a set. Fingerprint collisions
+      are theoretically possible, but negligible for any realistic stream size.
+    - approximate: fingerprints are kept in a BloomFilter sized for capacity triples
+      at the given error_rate; memory is fixed, but unique triples are dropped
+      at (approximately) error_rate if the filter reports a false positive.
+    """
+    match mode:
+        case "exact":
+            seen: set[bytes] = set()
+
+            for triple in triples:
+                fingerprint = blake2b(_encode(triple), digest_size=16).digest()
+
+                if fingerprint not in seen:
+                    seen.add(fingerprint)
+                    yield triple
+        case "approximate":
+            bloom_filter = BloomFilter(capacity, error_rate)
+
+            for triple in triples:
+                if not bloom_filter.add(_encode(triple)):
+                    yield triple
+        case _:
+            raise ValueError(
+                f"Unknown mode '{mode}'. Mode must be 'exact' or 'approximate'."
+            )
+
+
+def _encode(triple: Triple) -> bytes:
+    s, p, o = triple
+    return f"{s.n3()} {p.n3()} {_nt_term(o)}".encode("utf-8")
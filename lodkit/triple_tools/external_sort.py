@@ -0,0 +1,153 @@
+"""LODKit external sorting and deduplication for triple streams."""
+
+from collections.abc import Iterable, Iterator
+import heapq
+import itertools
+from operator import itemgetter
+import os
+from pathlib import Path, PurePath
+import re
+import struct
+import tempfile
+
+from rdflib import BNode, Literal, URIRef
+
+from lodkit.triple_tools.dedup import _encode
+from lodkit.types import Triple, TripleObject
+
+type _Record = tuple[bytes, Triple]
+type _SpilledRecord = tuple[bytes, int, int]
+
+# key length, subject length and predicate length (in bytes) of a spilled N-Triples key
+_HEADER = struct.Struct("<III")
+_ESCAPES = {"n": "\n", "r": "\r", '"': '"', "\\": "\\"}
+_ESCAPE_PATTERN = re.compile(r"\\(.)")
+
+
+def sorted_unique(
+    triples: Iterable[Triple],
+    run_size: int = 1_000_000,
+    directory: str | PurePath | None = None,
+    max_open_runs: int = 256,
+) -> Iterator[Triple]:
+    """Sort and exactly deduplicate a triple stream in bounded memory.
+
+    Triples are keyed by their N-Triples encoding and collected in runs of at most run_size triples;
+    every run is sorted, deduplicated and spilled to a temporary file in directory
+    (default: the platform temp directory). Spilled runs only hold the N-Triples keys,
+    triples are decoded from the keys when the merged stream is yielded.
+
+    Runs are k-way merged and adjacent duplicates are dropped; at most max_open_runs runs
+    are opened at the same time, so if there are more runs, they are merged into
+    intermediate runs in several passes until a single pass can merge all of them.
+
+    Output order is the byte order of the N-Triples lines, i.e. the order of `LC_ALL=C sort`.
+    If the stream fits into a single run, nothing is written to disk.
+    Temporary files are removed once the stream is exhausted or closed.
+    """
+    if max_open_runs < 2:
+        raise ValueError("max_open_runs must be at least 2.")
+
+    batches = itertools.batched(triples, run_size)
+    first_batch = next(batches, ())
+    first_run = _sorted_run(first_batch)
+
+    # a short batch means the stream is exhausted; the deduplicated run may be shorter
+    if len(first_batch) < run_size:
+        yield from map(itemgetter(1), first_run)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="lodkit-", dir=directory) as tmp:
+        run_names = (Path(tmp, f"{i}.run") for i in itertools.count())
+
+        paths = [_spill(first_run, next(run_names))]
+        del first_batch, first_run
+
+        for batch in batches:
+            paths.append(_spill(_sorted_run(batch), next(run_names)))
+
+        while len(paths) > max_open_runs:
+            paths = [
+                _write_run(_merge(group), next(run_names))
+                for group in itertools.batched(paths, max_open_runs)
+            ]
+
+        for key, subject_length, predicate_length in _merge(paths):
+            yield _decode(key, subject_length, predicate_length)
+
+
+def _sorted_run(batch: Iterable[Triple]) -> list[_Record]:
+    return sorted(
+        {_encode(triple): triple for triple in batch}.items(), key=itemgetter(0)
+    )
+
+
+def _spill(run: list[_Record], path: Path) -> Path:
+    return _write_run(
+        (
+            (key, len(s.n3().encode("utf-8")), len(p.n3().encode("utf-8")))
+            for key, (s, p, _) in run
+        ),
+        path,
+    )
+
+
+def _write_run(records: Iterable[_SpilledRecord], path: Path) -> Path:
+    with open(path, "wb") as f:
+        for key, subject_length, predicate_length in records:
+            f.write(_HEADER.pack(len(key), subject_length, predicate_length))
+            f.write(key)
+
+    return path
+
+
+def _read_run(path: Path) -> Iterator[_SpilledRecord]:
+    with open(path, "rb") as f:
+        while header := f.read(_HEADER.size):
+            key_length, subject_length, predicate_length = _HEADER.unpack(header)
+            yield f.read(key_length), subject_length, predicate_length
+
+
+def _merge(paths: Iterable[Path]) -> Iterator[_SpilledRecord]:
+    """Merge sorted runs, drop adjacent duplicates and remove the merged run files."""
+    paths = list(paths)
+    previous: bytes | None = None
+
+    for record in heapq.merge(*map(_read_run, paths), key=itemgetter(0)):
+        if record[0] != previous:
+            previous = record[0]
+            yield record
+
+    for path in paths:
+        os.remove(path)
+
+
+def _decode(key: bytes, subject_length: int, predicate_length: int) -> Triple:
+    """Decode a triple from its N-Triples key."""
+    object_start = subject_length + predicate_length + 2
+
+    return (
+        _decode_term(key[:subject_length].decode("utf-8")),
+        URIRef(key[subject_length + 2 : object_start - 2].decode("utf-8")),
+        _decode_term(key[object_start:].decode("utf-8")),
+    )
+
+
+def _decode_term(term: str) -> TripleObject:
+    if term.startswith("<"):
+        return URIRef(term[1:-1])
+    if term.startswith("_:"):
+        return BNode(term[2:])
+
+    end = term.rfind('"')
+    lexical = term[1:end]
+    suffix = term[end + 1 :]
+
+    if "\\" in lexical:
+        lexical = _ESCAPE_PATTERN.sub(lambda match: _ESCAPES[match[1]], lexical)
+
+    if suffix.startswith("@"):
+        return Literal(lexical, lang=suffix[1:])
+    if suffix.startswith("^^"):
+        return Literal(lexical, datatype=URIRef(suffix[3:-1]), normalize=False)
+    return Literal(lexical)
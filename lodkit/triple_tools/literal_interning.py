@@ -0,0 +1,40 @@
+"""LODKit Literal interning for str to rdflib.Literal conversion."""
+
+from collections.abc import Callable
+import functools
+
+from rdflib import Literal
+
+
+_literal_factory: Callable[[str], Literal] = Literal
+
+
+def enable_literal_interning(maxsize: int | None = 2**16) -> None:
+    """Route str to rdflib.Literal conversion through a bounded LRU cache.
+
+    After calling enable_literal_interning, plain str objects in ttl objects and TTLTemplate
+    bindings resolve to cached rdflib.Literal instances; repeated values therefore share a single
+    Literal object across all ttl instances and graphs. Calling the function again
+    replaces the cache with a new, empty cache of the given maxsize.
+
+    Since rdflib.Literal objects are immutable, sharing cached instances is safe.
+    """
+    global _literal_factory
+    _literal_factory = functools.lru_cache(maxsize=maxsize, typed=True)(Literal)
+
+
+def disable_literal_interning() -> None:
+    """Discard the Literal cache and restore plain rdflib.Literal construction."""
+    global _literal_factory
+    _literal_factory = Literal
+
+
+def literal_cache_info() -> functools._CacheInfo | None:
+    """Return hit/miss statistics of the Literal cache or None if interning is disabled."""
+    cache_info = getattr(_literal_factory, "cache_info", None)
+    return None if cache_info is None else cache_info()
+
+
+def get_literal_factory() -> Callable[[str], Literal]:
+    """Return the currently active str to rdflib.Literal conversion callable."""
+    return _literal_factory
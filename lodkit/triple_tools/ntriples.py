@@ -0,0 +1,102 @@
+"""LODKit streaming N-Triples/N-Quads serialization."""
+
+from collections.abc import Iterable
+import itertools
+from pathlib import PurePath
+from typing import IO, Self
+
+from rdflib import BNode, Literal, URIRef
+
+from lodkit.types import RDFTerm, Triple
+
+
+class NTriplesWriter:
+    """Buffered streaming writer for N-Triples and N-Quads.
+
+    NTriplesWriter encodes triples to line-based N-Triples and writes them
+    to a binary file handle in batches of batch_size lines; if a graph_name is provided,
+    N-Quads lines with graph_name in the graph label position are written instead.
+
+    Only a single batch of encoded lines is held in memory at any time,
+    so memory consumption is independent of the number of triples written.
+    """
+
+    def __init__(
+        self,
+        file: IO[bytes],
+        graph_name: URIRef | BNode | None = None,
+        batch_size: int = 10_000,
+    ) -> None:
+        self.file = file
+        self.graph_name = graph_name
+        self.batch_size = batch_size
+
+        self._line_end: str = (
+            " .\n" if graph_name is None else f" {graph_name.n3()} .\n"
+        )
+
+    def write(self, triples: Iterable[Triple]) -> int:
+        """Write triples to the file handle and return the number of written lines."""
+        count = 0
+
+        for batch in itertools.batched(triples, self.batch_size):
+            self.file.write(self._encode(batch))
+            count += len(batch)
+
+        return count
+
+    def _encode(self, triples: Iterable[Triple]) -> bytes:
+        line_end = self._line_end
+
+        return "".join(
+            [f"{s.n3()} {p.n3()} {_nt_term(o)}{line_end}" for s, p, o in triples]
+        ).encode("utf-8")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.file.flush()
+
+
+def serialize_stream(
+    triples: Iterable[Triple],
+    destination: IO[bytes] | str | PurePath,
+    graph_name: URIRef | BNode | None = None,
+    batch_size: int = 10_000,
+) -> int:
+    """Stream triples to an N-Triples/N-Quads destination.
+
+    The destination is either a binary file handle or a path;
+    paths are opened for (over)writing.
+
+    Returns the number of written lines.
+    """
+    if isinstance(destination, (str, PurePath)):
+        with open(destination, "wb") as f:
+            return serialize_stream(triples, f, graph_name, batch_size)
+
+    with NTriplesWriter(destination, graph_name, batch_size) as writer:
+        return writer.write(triples)
+
+
+def _nt_term(term: RDFTerm) -> str:
+    """Encode an RDF term in N-Triples syntax.
+
+    Unlike Literal.n3, this never produces Turtle long string or shorthand literal syntax.
+    """
+    if isinstance(term, Literal):
+        lexical = (
+            term.replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+        if term.language:
+            return f'"{lexical}"@{term.language}'
+        if term.datatype:
+            return f'"{lexical}"^^<{term.datatype}>'
+        return f'"{lexical}"'
+
+    return term.n3()
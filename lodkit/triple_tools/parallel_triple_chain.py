@@ -0,0 +1,147 @@
+"""LODKit process-parallel TripleChain."""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import functools
+import itertools
+from multiprocessing.context import BaseContext
+import os
+from typing import Self
+
+from lodkit.triple_tools.triple_chain import TripleChain
+from lodkit.types import Triple
+
+type TTripleSource = Callable[[], Iterable[Triple]]
+
+
+class ParallelTripleChain(TripleChain):
+    """TripleChain that generates triples in a process pool.
+
+    ParallelTripleChain takes triple-producing callables (sources); every source is called
+    in a worker process of a concurrent.futures.ProcessPoolExecutor and the resulting triples
+    are merged into the chain in the main process. Sources and their triples must be picklable.
+
+    If ordered is True, triples are yielded in source order; else triples of a source
+    are yielded as soon as the source is finished. At most max_pending sources
+    (default: twice the number of workers) are submitted to the pool at any time,
+    so sources are consumed lazily and the main process is not flooded with results
+    if the sink is slower than triple generation.
+
+    The process pool is only started once the chain is iterated, e.g. by calling to_graph or to_file.
+    """
+
+    def __new__(
+        cls,
+        *sources: TTripleSource,
+        max_workers: int | None = None,
+        ordered: bool = True,
+        max_pending: int | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> Self:
+        return cls._from_sources(
+            sources,
+            max_workers=max_workers,
+            ordered=ordered,
+            max_pending=max_pending,
+            mp_context=mp_context,
+        )
+
+    @classmethod
+    def _from_sources(
+        cls,
+        sources: Iterable[TTripleSource],
+        max_workers: int | None = None,
+        ordered: bool = True,
+        max_pending: int | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> Self:
+        """Construct a ParallelTripleChain from a (possibly lazy) iterable of sources."""
+        max_workers = max_workers or os.cpu_count() or 1
+
+        return super().__new__(
+            cls,
+            _generate_parallel(
+                sources,
+                max_workers=max_workers,
+                ordered=ordered,
+                max_pending=max_pending or 2 * max_workers,
+                mp_context=mp_context,
+            ),
+        )
+
+    @classmethod
+    def from_partitions[T](
+        cls,
+        function: Callable[[T], Iterable[Triple]],
+        partitions: Iterable[T],
+        chunk_size: int = 1,
+        **kwargs,
+    ) -> Self:
+        """Construct a ParallelTripleChain that maps function over input partitions.
+
+        Partitions are grouped into chunks of chunk_size partitions;
+        every chunk is processed as a single source in a worker process.
+        Larger chunks reduce inter-process overhead for many small partitions.
+        Partitions are consumed lazily, i.e. only as chunks are submitted to the pool.
+        """
+        sources = (
+            functools.partial(_map_partitions, function, chunk)
+            for chunk in itertools.batched(partitions, chunk_size)
+        )
+        return cls._from_sources(sources, **kwargs)
+
+    def chain(self, *others: Iterable[Triple]) -> TripleChain:  # type: ignore[override]
+        """Chain other triple iterables; the resulting chain is a regular TripleChain."""
+        return TripleChain(self, *others)
+
+
+def _generate_parallel(
+    sources: Iterable[TTripleSource],
+    max_workers: int,
+    ordered: bool,
+    max_pending: int,
+    mp_context: BaseContext | None,
+) -> Iterator[Triple]:
+    """Submit sources to a process pool and yield their triples.
+
+    Results are collected before refilling the pool, so workers keep
+    generating triples while the main process yields to the sink.
+    """
+    _sources: Iterator[TTripleSource] = iter(sources)
+    pending: deque[Future[list[Triple]]] = deque()
+
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    def _submit(n: int) -> None:
+        for source in itertools.islice(_sources, n):
+            pending.append(executor.submit(_run_source, source))
+
+    try:
+        _submit(max_pending)
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+
+            results = [future.result() for future in done]
+            _submit(len(done))
+
+            for triples in results:
+                yield from triples
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_source(source: TTripleSource) -> list[Triple]:
+    return list(source())
+
+
+def _map_partitions[T](
+    function: Callable[[T], Iterable[Triple]], partitions: Iterable[T]
+) -> Iterator[Triple]:
+    return itertools.chain.from_iterable(map(function, partitions))
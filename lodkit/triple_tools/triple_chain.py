@@ -1,21 +1,77 @@
 from collections.abc import Iterable
 import itertools
+from pathlib import PurePath
 from typing import Self
 
-from lodkit.triple_tools.utils import _ToGraphMixin
+from lodkit.triple_tools.dedup import TUniqueMode, unique
+from lodkit.triple_tools.external_sort import sorted_unique
+from lodkit.triple_tools.utils import (
+    TTripleSink,
+    _BatchedMixin,
+    _ToDatasetMixin,
+    _ToFileMixin,
+    _ToGraphMixin,
+    fan_out,
+)
 from lodkit.types import Triple
 
 
-class TripleChain(itertools.chain[Triple], _ToGraphMixin):
+class TripleChain(
+    itertools.chain[Triple],
+    _ToGraphMixin,
+    _ToDatasetMixin,
+    _ToFileMixin,
+    _BatchedMixin,
+):
     """A simple itertools.chain for chaining lodkit._Triple iterables.
 
     TripleChain implements a fluid chain interface,
     i.e TripleChain objects can be chained repeatedly.
 
     TripleChain also exposes a to_graph method that generates a Graph
-    from the triples stored in the TripleChain.
-    Note that calling to_graph exhausts the TripleChain object.
+    from the triples stored in the TripleChain and a to_file method
+    that streams the triples to an N-Triples/N-Quads file.
+
+    Besides triples, TripleChain objects can chain quads (e.g. from ttl.quads)
+    which are routed into their named graphs by to_dataset.
+    Note that calling to_graph or to_file exhausts the TripleChain object.
     """
 
     def chain(self, *others: Iterable[Triple]) -> Self:
         return self.__class__(self, *others)
+
+    def fan_out(
+        self, *sinks: TTripleSink, batch_size: int = 10_000, trusted: bool = False
+    ) -> int:
+        """Consume the TripleChain once and pass every batch of triples to all sinks.
+
+        See lodkit.triple_tools.utils.fan_out for applicable sinks.
+        Note that calling fan_out exhausts the TripleChain object.
+        """
+        return fan_out(self, *sinks, batch_size=batch_size, trusted=trusted)
+
+    def unique(
+        self,
+        mode: TUniqueMode = "exact",
+        capacity: int = 10_000_000,
+        error_rate: float = 1e-6,
+    ) -> "TripleChain":
+        """Return a TripleChain that yields every distinct triple once.
+
+        See lodkit.triple_tools.dedup.unique for the exact and approximate modes.
+        """
+        return TripleChain(unique(self, mode, capacity, error_rate))
+
+    def sorted_unique(
+        self,
+        run_size: int = 1_000_000,
+        directory: str | PurePath | None = None,
+        max_open_runs: int = 256,
+    ) -> "TripleChain":
+        """Return a TripleChain that yields distinct triples in N-Triples byte order.
+
+        Sorting and deduplication spill sorted runs of at most run_size triples to disk,
+        so memory is bounded independently of the stream size; at most max_open_runs
+        run files are open at any time. See lodkit.triple_tools.external_sort.sorted_unique.
+        """
+        return TripleChain(sorted_unique(self, run_size, directory, max_open_runs))
@@ -1,12 +1,20 @@
 """LODKit Triple utilities."""
 
-from collections.abc import Iterable, Iterator
-from typing import Never
+from collections.abc import Callable, Iterable, Iterator
+from hashlib import sha256
+from typing import Never, Self
 
 from rdflib import RDF, BNode, Literal, URIRef
 
-from lodkit.triple_tools.utils import _ToGraphMixin
-from lodkit.types import Triple, TripleObject, TripleSubject
+from lodkit.triple_tools.literal_interning import get_literal_factory
+from lodkit.triple_tools.ntriples import _nt_term
+from lodkit.triple_tools.utils import (
+    _BatchedMixin,
+    _ToDatasetMixin,
+    _ToFileMixin,
+    _ToGraphMixin,
+)
+from lodkit.types import GraphName, Quad, Triple, TripleObject, TripleSubject
 
 type TPredicateObjectPairObject = (
     TripleObject
@@ -18,49 +26,299 @@ type TPredicateObjectPairObject = (
 
 type TPredicateObjectPair = tuple[URIRef, *tuple[TPredicateObjectPairObject, ...]]
 
+type _Assertion = tuple[TripleSubject, URIRef, TPredicateObjectPairObject]
+
+_RDF_TERMS = (URIRef, BNode, Literal)
+
+
+class ttl(
+    Iterable[Triple], _ToGraphMixin, _ToDatasetMixin, _ToFileMixin, _BatchedMixin
+):
+    """Triple generation facility that implements a Turtle-like interface.
+
+    If skolemize is True, blank nodes for [] subjects, blank node lists and RDF collection cells
+    are not minted randomly, but derived from a hash of their content, i.e. of their
+    predicate-object assertions. Identical blank node structures therefore resolve
+    to the same blank node across ttl objects, runs and processes.
+    Note that skolemization applies to the structure expanded by a given ttl object;
+    nested ttl objects are expanded according to their own skolemize setting,
+    i.e. nested ttl([]) objects are only deterministic if they are skolemized themselves.
 
-class ttl(Iterable[Triple], _ToGraphMixin):
-    """Triple generation facility that implements a Turtle-like interface."""
+    If a graph_name is provided, ttl.quads generates quads for that named graph
+    and ttl.to_dataset adds the triples to that named graph.
+    """
 
     def __init__(
         self,
         subject: TripleSubject | list[Never],
         *predicate_object_pairs: TPredicateObjectPair,
+        skolemize: bool = False,
+        graph_name: GraphName | None = None,
     ) -> None:
-        self.subject = BNode() if subject == [] else subject
         self.predicate_object_pairs = predicate_object_pairs
+        self.skolemize = skolemize
+        self.graph_name = graph_name
+
+        if subject == []:
+            self.subject = (
+                BNode(_skolem_ids(list(predicate_object_pairs), {})[0])
+                if skolemize
+                else BNode()
+            )
+        else:
+            self.subject = subject
 
     def __iter__(self) -> Iterator[Triple]:
-        """Generate an iterator of 3-tuple triple representations."""
+        """Generate an iterator of 3-tuple triple representations.
+
+        Nested ttl objects, blank node lists and RDF collections are not expanded recursively;
+        pending assertions are kept on an explicit work stack, so arbitrarily deep
+        or long structures are processed in constant Python stack depth.
+        Every stack frame carries the skolem id memo of the ttl object it was expanded from
+        (None if that object is not skolemized), so nested ttl objects keep their own skolemize setting.
+        """
+        memo: dict[int, list[str]] = {}
+        stack: list[tuple[Iterator[_Assertion], dict[int, list[str]] | None]] = [
+            (
+                _assertions(self.subject, self.predicate_object_pairs),
+                memo if self.skolemize else None,
+            )
+        ]
+        literal = get_literal_factory()
 
-        for pred, *objs in self.predicate_object_pairs:
-            for obj in objs:
+        while stack:
+            assertions, skolem_ids = stack[-1]
+
+            for subject, pred, obj in assertions:
                 match obj:
+                    case str() if isinstance(obj, _RDF_TERMS):
+                        yield (subject, pred, obj)
+                    case str():
+                        yield (subject, pred, literal(obj))
+                    case ttl() if type(obj).__iter__ is ttl.__iter__:
+                        yield (subject, pred, obj.subject)
+                        stack.append(
+                            (
+                                _assertions(obj.subject, obj.predicate_object_pairs),
+                                memo if obj.skolemize else None,
+                            )
+                        )
+                        break
                     case ttl():
-                        yield (self.subject, pred, obj.subject)
+                        yield (subject, pred, obj.subject)
                         yield from obj
+                    case list() if skolem_ids is None:
+                        _b = BNode()
+                        yield (subject, pred, _b)
+                        stack.append((_assertions(_b, obj), skolem_ids))
+                        break
                     case list():
+                        _b = BNode(_skolem_ids(obj, skolem_ids)[0])
+                        yield (subject, pred, _b)
+                        stack.append((_assertions(_b, obj), skolem_ids))
+                        break
+                    case tuple() if obj and skolem_ids is None:
                         _b = BNode()
-                        yield (self.subject, pred, _b)
-                        yield from ttl(_b, *obj)
-                    case tuple():
-                        first, *rest = obj
-                        yield from ttl(
-                            self.subject,
-                            (
-                                pred,
-                                [
-                                    (RDF.first, first),
-                                    (RDF.rest, tuple(rest) or RDF.nil),
-                                ],
-                            ),
+                        yield (subject, pred, _b)
+                        stack.append((_collection(_b, obj), skolem_ids))
+                        break
+                    case tuple() if obj:
+                        _b, *cells = map(BNode, _skolem_ids(obj, skolem_ids))
+                        yield (subject, pred, _b)
+                        stack.append(
+                            (_collection(_b, obj, iter(cells).__next__), skolem_ids)
                         )
-                    case obj if isinstance(obj, (URIRef, BNode, Literal)):
-                        yield (self.subject, pred, obj)
-                    case str():
-                        yield (self.subject, pred, Literal(obj))
+                        break
+                    case tuple():
+                        raise _empty_collection_error()
                     case _:
-                        raise TypeError(
-                            f"Unable to process triple object '{obj}'. "
-                            "See the ttl docs and type annotation for applicable object types."
-                        )
+                        raise _object_type_error(obj)
+            else:
+                stack.pop()
+
+    def quads(self) -> Iterator[Quad]:
+        """Generate an iterator of 4-tuple quad representations with graph_name in the graph position.
+
+        Quads can be chained with triples in a TripleChain and routed into named graphs with to_dataset.
+        """
+        graph_name = self.graph_name
+        return ((s, p, o, graph_name) for s, p, o in self)
+
+    def frozen(self) -> "FrozenTTL":
+        """Materialize the ttl object into a FrozenTTL.
+
+        The triple expansion runs exactly once; subsequent iterations
+        of the FrozenTTL object yield the cached triples.
+        """
+        return FrozenTTL(
+            self.subject,
+            *self.predicate_object_pairs,
+            skolemize=self.skolemize,
+            graph_name=self.graph_name,
+        )
+
+
+class FrozenTTL(ttl):
+    """Materialized ttl object.
+
+    FrozenTTL expands its predicate-object pairs once on initialization and caches
+    the resulting triples in a tuple. Iteration and len are therefore free
+    and always yield the same triples, including blank nodes.
+
+    FrozenTTL objects are usually obtained by calling ttl.frozen.
+    """
+
+    def __init__(
+        self,
+        subject: TripleSubject | list[Never],
+        *predicate_object_pairs: TPredicateObjectPair,
+        skolemize: bool = False,
+        graph_name: GraphName | None = None,
+    ) -> None:
+        super().__init__(
+            subject,
+            *predicate_object_pairs,
+            skolemize=skolemize,
+            graph_name=graph_name,
+        )
+        self.triples: tuple[Triple, ...] = tuple(super().__iter__())
+
+    def __iter__(self) -> Iterator[Triple]:
+        return iter(self.triples)
+
+    def __len__(self) -> int:
+        return len(self.triples)
+
+    def frozen(self) -> Self:
+        return self
+
+
+def _assertions(
+    subject: TripleSubject, predicate_object_pairs: Iterable[TPredicateObjectPair]
+) -> Iterator[_Assertion]:
+    """Flatten predicate-object pairs into pending (subject, predicate, object) assertions."""
+    return (
+        (subject, pred, obj) for pred, *objs in predicate_object_pairs for obj in objs
+    )
+
+
+def _collection(
+    node: BNode,
+    items: tuple[TPredicateObjectPairObject, ...],
+    mint: Callable[[], BNode] = BNode,
+) -> Iterator[_Assertion]:
+    """Generate pending rdf:first/rdf:rest assertions for an RDF collection.
+
+    Cells are emitted in a flat loop, so the length of a collection
+    does not affect stack depth. Blank nodes for succeeding cells are obtained from mint.
+    """
+    *init, last = items
+
+    for item in init:
+        yield (node, RDF.first, item)
+        node_rest = mint()
+        yield (node, RDF.rest, node_rest)
+        node = node_rest
+
+    yield (node, RDF.first, last)
+    yield (node, RDF.rest, RDF.nil)
+
+
+def _skolem_ids(
+    obj: list[TPredicateObjectPair] | tuple[TPredicateObjectPairObject, ...],
+    memo: dict[int, list[str]],
+) -> list[str]:
+    """Compute content-hashed blank node ids for a blank node list or an RDF collection.
+
+    The id of a blank node is the sha256 digest of its sorted predicate-object assertions in
+    N-Triples syntax, where nested blank nodes are represented by their own content-hashed ids.
+    For blank node lists, a single id is returned; for RDF collections, the ids of all cells.
+
+    Nested structures are processed in post-order using an explicit work stack;
+    ids are memoized by object identity in memo, so structures are hashed at most once.
+    """
+    stack: list[tuple[list | tuple, bool]] = [(obj, False)]
+
+    while stack:
+        current, children_done = stack.pop()
+
+        if id(current) in memo:
+            continue
+
+        if not children_done:
+            stack.append((current, True))
+            stack.extend(
+                (child, False)
+                for child in _bnode_children(current)
+                if id(child) not in memo
+            )
+            continue
+
+        if isinstance(current, list):
+            memo[id(current)] = [
+                _content_hash(
+                    (pred, _skolem_object(item, memo))
+                    for pred, *items in current
+                    for item in items
+                )
+            ]
+        else:
+            if not current:
+                raise _empty_collection_error()
+
+            cells: list[str] = []
+            rest = RDF.nil.n3()
+
+            for item in reversed(current):
+                cell = _content_hash(
+                    ((RDF.first, _skolem_object(item, memo)), (RDF.rest, rest))
+                )
+                cells.append(cell)
+                rest = f"_:{cell}"
+
+            memo[id(current)] = cells[::-1]
+
+    return memo[id(obj)]
+
+
+def _bnode_children(obj: list | tuple) -> Iterator[list | tuple]:
+    """Generate blank node lists and RDF collections directly nested in obj."""
+    if isinstance(obj, list):
+        items = (item for _, *objs in obj for item in objs)
+    else:
+        items = iter(obj)
+
+    return (child for child in items if isinstance(child, (list, tuple)))
+
+
+def _skolem_object(obj: TPredicateObjectPairObject, memo: dict[int, list[str]]) -> str:
+    """Encode a triple object for content hashing; nested blank node ids must be memoized."""
+    match obj:
+        case str() if isinstance(obj, _RDF_TERMS):
+            return _nt_term(obj)
+        case str():
+            return _nt_term(Literal(obj))
+        case ttl():
+            return obj.subject.n3()
+        case list() | tuple():
+            return f"_:{memo[id(obj)][0]}"
+        case _:
+            raise _object_type_error(obj)
+
+
+def _content_hash(assertions: Iterable[tuple[URIRef, str]]) -> str:
+    lines = sorted(f"{pred.n3()} {obj}" for pred, obj in assertions)
+    return "b" + sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+def _object_type_error(obj: object) -> TypeError:
+    return TypeError(
+        f"Unable to process triple object '{obj}'. "
+        "See the ttl docs and type annotation for applicable object types."
+    )
+
+
+def _empty_collection_error() -> ValueError:
+    return ValueError(
+        "Unable to process empty RDF collection. Use rdflib.RDF.nil for an empty list."
+    )
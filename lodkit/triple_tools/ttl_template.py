@@ -0,0 +1,250 @@
+"""LODKit compiled ttl templates."""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+import functools
+from operator import itemgetter
+from typing import Any, Never
+
+from rdflib import RDF, BNode, Literal, URIRef
+
+from lodkit.triple_tools.literal_interning import get_literal_factory
+from lodkit.triple_tools.triple_chain import TripleChain
+from lodkit.triple_tools.ttl_constructor import (
+    _RDF_TERMS,
+    _empty_collection_error,
+    _object_type_error,
+    ttl,
+)
+from lodkit.types import RDFTerm, Triple, TripleSubject
+
+type TTemplateRecord = Mapping[str, Any] | Sequence[Any]
+
+type _Reference = tuple[str, int]
+
+
+class Placeholder:
+    """Named placeholder for a triple subject or object in a TTLTemplate.
+
+    Values bound to a placeholder are processed like ttl objects, i.e. RDF terms are used as is
+    and plain strings are interpreted as rdflib.Literal (subject placeholders only accept URIRefs and BNodes).
+
+    If a converter is provided, bound values are passed through the converter instead,
+    e.g. Placeholder("id", converter=make_uri) for minting subject URIs from record keys.
+    """
+
+    __slots__ = ("name", "converter")
+
+    def __init__(
+        self, name: str, converter: Callable[[Any], RDFTerm] | None = None
+    ) -> None:
+        self.name = name
+        self.converter = converter
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"{self.__class__.__name__}({self.name!r})"
+
+
+class TTLTemplate:
+    """Compiled ttl shape for binding the same triple structure against many records.
+
+    TTLTemplate takes the same arguments as lodkit.ttl, but allows Placeholder objects
+    in the subject and object positions. The predicate-object structure is compiled once
+    on initialization, so binding a record only looks up placeholder values,
+    mints blank nodes and emits triples without re-dispatching on object types.
+
+    Records are either mappings (placeholder values are looked up by name)
+    or sequences (placeholder values are looked up by position in TTLTemplate.fields).
+    Unless fields are given explicitly, placeholder names are ordered by first appearance.
+
+    Blank nodes ([] subjects, lists, RDF collections, nested ttl([]) subjects
+    and rdflib.BNode terms in the template) are minted per record;
+    occurrences of the same BNode term in the template resolve to the same blank node per record.
+    """
+
+    def __init__(
+        self,
+        subject: TripleSubject | Placeholder | list[Never],
+        *predicate_object_pairs: tuple,
+        fields: Sequence[str] | None = None,
+    ) -> None:
+        self._constants: list[Any] = []
+        self._placeholders: dict[str, Placeholder] = {}
+        self._subject_placeholders: set[str] = set()
+        self._bnodes: int = 0
+        self._bnode_terms: dict[BNode, _Reference] = {}
+        self._references: list[tuple[_Reference, URIRef, _Reference]] = []
+
+        self._compile_pairs(
+            self._reference(subject, is_subject=True), predicate_object_pairs
+        )
+
+        self.fields: tuple[str, ...] = (
+            tuple(self._placeholders) if fields is None else tuple(fields)
+        )
+
+        if missing := set(self._placeholders) - set(self.fields):
+            raise ValueError(f"Fields do not cover placeholders {sorted(missing)}.")
+
+        self._converters: tuple[Callable[[Any], RDFTerm], ...] = tuple(
+            self._placeholders[name].converter
+            or (_to_subject if name in self._subject_placeholders else _to_object)
+            for name in self._placeholders
+        )
+        self._key_getter = _tuple_getter(*self._placeholders)
+        self._index_getter = _tuple_getter(
+            *(self.fields.index(name) for name in self._placeholders)
+        )
+
+        self._operations: list[tuple[int, URIRef, int]] = self._resolve_references()
+
+    def bind(self, records: Iterable[TTemplateRecord]) -> TripleChain:
+        """Bind the template against an iterable of records and return a TripleChain."""
+        return TripleChain(self._bind(records))
+
+    def _bind(self, records: Iterable[TTemplateRecord]) -> Iterator[Triple]:
+        constants, operations = self._constants, self._operations
+        bnodes = range(self._bnodes)
+
+        _to_object_literal = functools.partial(
+            _to_object, literal=get_literal_factory()
+        )
+        converters = tuple(
+            _to_object_literal if convert is _to_object else convert
+            for convert in self._converters
+        )
+
+        for record in records:
+            values = (
+                self._key_getter(record)
+                if isinstance(record, Mapping)
+                else self._index_getter(record)
+            )
+            env = [
+                *constants,
+                *[convert(value) for convert, value in zip(converters, values)],
+                *[BNode() for _ in bnodes],
+            ]
+
+            for s, p, o in operations:
+                yield (env[s], p, env[o])
+
+    def _compile_pairs(self, subject_ref: _Reference, predicate_object_pairs) -> None:
+        """Compile predicate-object pairs into (subject, predicate, object) references.
+
+        References point into a per-record environment of constants,
+        placeholder values and blank nodes; they are registered in the same order
+        as ttl would generate the corresponding triples.
+        """
+        for pred, *objs in predicate_object_pairs:
+            if not isinstance(pred, URIRef):
+                raise TypeError(
+                    f"Unable to process predicate '{pred}'. "
+                    "TTLTemplate predicates must be rdflib.URIRef instances."
+                )
+
+            for obj in objs:
+                self._compile_object(subject_ref, pred, obj)
+
+    def _compile_object(self, subject_ref: _Reference, pred: URIRef, obj) -> None:
+        match obj:
+            case ttl():
+                object_ref = self._reference(obj.subject, is_subject=True)
+                self._references.append((subject_ref, pred, object_ref))
+                self._compile_pairs(object_ref, obj.predicate_object_pairs)
+            case list():
+                object_ref = self._bnode()
+                self._references.append((subject_ref, pred, object_ref))
+                self._compile_pairs(object_ref, obj)
+            case tuple() if obj:
+                node_ref = self._bnode()
+                self._references.append((subject_ref, pred, node_ref))
+
+                *init, last = obj
+                for item in init:
+                    self._compile_object(node_ref, RDF.first, item)
+                    rest_ref = self._bnode()
+                    self._references.append((node_ref, RDF.rest, rest_ref))
+                    node_ref = rest_ref
+
+                self._compile_object(node_ref, RDF.first, last)
+                self._references.append((node_ref, RDF.rest, self._constant(RDF.nil)))
+            case tuple():
+                raise _empty_collection_error()
+            case _:
+                self._references.append(
+                    (subject_ref, pred, self._reference(obj, is_subject=False))
+                )
+
+    def _reference(self, term, is_subject: bool) -> _Reference:
+        match term:
+            case Placeholder():
+                if (
+                    registered := self._placeholders.setdefault(term.name, term)
+                ) is not term and registered.converter is not term.converter:
+                    raise ValueError(
+                        f"Placeholder '{term.name}' is defined with conflicting converters."
+                    )
+                if is_subject:
+                    self._subject_placeholders.add(term.name)
+                return ("placeholder", list(self._placeholders).index(term.name))
+            case list() if not term:
+                return self._bnode()
+            case BNode():
+                if (ref := self._bnode_terms.get(term)) is None:
+                    ref = self._bnode_terms[term] = self._bnode()
+                return ref
+            case _ if is_subject:
+                return self._constant(_to_subject(term))
+            case _:
+                return self._constant(_to_object(term, get_literal_factory()))
+
+    def _constant(self, term: RDFTerm) -> _Reference:
+        self._constants.append(term)
+        return ("constant", len(self._constants) - 1)
+
+    def _bnode(self) -> _Reference:
+        self._bnodes += 1
+        return ("bnode", self._bnodes - 1)
+
+    def _resolve_references(self) -> list[tuple[int, URIRef, int]]:
+        """Resolve symbolic references to indices into the per-record environment."""
+        offsets = {
+            "constant": 0,
+            "placeholder": len(self._constants),
+            "bnode": len(self._constants) + len(self._placeholders),
+        }
+
+        def _index(ref: _Reference) -> int:
+            kind, index = ref
+            return offsets[kind] + index
+
+        return [(_index(s), p, _index(o)) for s, p, o in self._references]
+
+
+def _to_subject(value: Any) -> TripleSubject:
+    if isinstance(value, (URIRef, BNode)):
+        return value
+    raise TypeError(
+        f"Unable to process triple subject '{value}'. "
+        "Subjects must be rdflib.URIRef or rdflib.BNode instances."
+    )
+
+
+def _to_object(value: Any, literal: Callable[[str], Literal] = Literal) -> RDFTerm:
+    if isinstance(value, _RDF_TERMS):
+        return value
+    if isinstance(value, str):
+        return literal(value)
+    raise _object_type_error(value)
+
+
+def _tuple_getter(*keys) -> Callable[[Any], tuple]:
+    """Return an operator.itemgetter that always returns a tuple."""
+    match keys:
+        case ():
+            return lambda _: ()
+        case (key,):
+            getter = itemgetter(key)
+            return lambda record: (getter(record),)
+        case _:
+            return itemgetter(*keys)
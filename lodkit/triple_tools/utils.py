@@ -1,24 +1,290 @@
 """LODKit triple tools utils."""
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+import itertools
+from pathlib import PurePath
+from typing import IO
 import warnings
 
-from rdflib import Graph
+from rdflib import BNode, ConjunctiveGraph, Dataset, Graph, URIRef
+from rdflib.store import Store
+from rdflib.term import Node
 
-from lodkit.types import Triple
+from lodkit.store_tools.sqlite_store import SQLITE_URL_PREFIX, SQLiteStore
+from lodkit.triple_tools.ntriples import NTriplesWriter, serialize_stream
+from lodkit.types import GraphName, Quad, Triple
 
 
 class _ToGraphMixin:
     """Mixin that adds a to_graph method for generating graphs from Iterable[_Triple] objects."""
 
-    def to_graph(self: Iterable[Triple], graph: Graph | None = None) -> Graph:
-        _graph: Graph = Graph() if graph is None else graph
+    def to_graph(
+        self: Iterable[Triple],
+        graph: Graph | None = None,
+        batch_size: int = 10_000,
+        trusted: bool = False,
+        store: Store | str | None = None,
+    ) -> Graph:
+        """Add triples to a graph (by default a new rdflib.Graph) and return the graph.
 
-        for triple in self:
-            _graph.add(triple)
+        Triples are added in batches of batch_size triples through the bulk insertion path
+        of the graph's store. If trusted is True, triples are not checked for valid RDF terms.
+        Note that only stores with an actual bulk Store.addN (e.g. lodkit's SQLiteStore and CompactStore)
+        benefit from batching and trusted; rdflib's default Memory store adds triples one by one regardless.
 
-        if not _graph:
+        Instead of a graph, a store can be passed to add triples to a new graph backed by that store,
+        e.g. store="sqlite:///graph.db" opens (or creates) a persistent lodkit SQLiteStore;
+        other strings are interpreted as rdflib store plugin names.
+        """
+        _graph: Graph = _resolve_graph(graph, store)
+
+        # only count the graph if nothing was added, len is a full scan for some stores
+        if not _add_triples(_graph, self, batch_size, trusted) and not _graph:
             msg = f"Graph object '{_graph}' is empty. This might indicate an exhausted iterator."
             warnings.warn(msg)
 
         return _graph
+
+
+def _resolve_graph(graph: Graph | None, store: Store | str | None) -> Graph:
+    """Return the target graph for to_graph given either a graph or a store."""
+    match graph, store:
+        case Graph(), None:
+            return graph
+        case None, None:
+            return Graph()
+        case None, str() if store.startswith(SQLITE_URL_PREFIX):
+            sqlite_store = SQLiteStore()
+            sqlite_store.open(store, create=True)
+            return Graph(store=sqlite_store)
+        case None, Store() | str():
+            return Graph(store=store)
+        case None, _:
+            raise TypeError(
+                f"Unable to process store '{store}'. "
+                "Stores must be rdflib.Store objects, sqlite:/// URLs or rdflib store plugin names."
+            )
+        case _:
+            raise ValueError("Only one of graph and store can be passed.")
+
+
+def _add_triples(
+    graph: Graph,
+    triples: Iterable[Triple],
+    batch_size: int = 10_000,
+    trusted: bool = False,
+) -> int:
+    """Add triples to graph in batches using Store.addN and return the number of added triples.
+
+    Passing quads with the graph as context directly to the store skips the per-triple
+    method dispatch and assertions of Graph.add; unless trusted is True, terms are
+    still checked to be rdflib terms for every batch.
+
+    Since ConjunctiveGraph/Dataset objects route triples to their default graph on add,
+    triples are added one by one for those graph types.
+
+    The count includes triples already in the graph; it is tracked so that callers
+    need not call len on the graph, which is expensive for some stores (e.g. COUNT(*) in SQLiteStore).
+    """
+    count = 0
+
+    if isinstance(graph, ConjunctiveGraph):
+        for triple in triples:
+            graph.add(triple)
+            count += 1
+        return count
+
+    add_quads = graph.store.addN
+
+    for batch in itertools.batched(triples, batch_size):
+        count += len(batch)
+
+        if trusted:
+            add_quads([(s, p, o, graph) for s, p, o in batch])
+            continue
+
+        quads = [
+            (s, p, o, graph)
+            for s, p, o in batch
+            if isinstance(s, Node) and isinstance(p, Node) and isinstance(o, Node)
+        ]
+
+        if len(quads) != len(batch):
+            invalid = next(
+                triple
+                for triple in batch
+                if not all(isinstance(term, Node) for term in triple)
+            )
+            raise TypeError(
+                f"Unable to add triple {invalid!r}. All triple terms must be rdflib terms."
+            )
+
+        add_quads(quads)
+
+    return count
+
+
+class _ToDatasetMixin:
+    """Mixin that adds a to_dataset method for routing Iterable[_Triple | _Quad] objects into named graphs."""
+
+    graph_name: GraphName | None = None
+
+    def to_dataset(
+        self: Iterable[Triple | Quad],
+        dataset: Dataset | None = None,
+        graph_name: GraphName | None = None,
+        batch_size: int = 10_000,
+        trusted: bool = False,
+    ) -> Dataset:
+        """Add triples and quads to a dataset (by default a new rdflib.Dataset) and return the dataset.
+
+        Quads are added to the named graph of their graph name (None denotes the default graph);
+        triples are added to the named graph graph_name, i.e. by default to the graph_name
+        of the object or else to the default graph of the dataset.
+
+        Statements are added in batches of batch_size statements through the bulk insertion path
+        of the dataset's store. If trusted is True, statements are not checked for valid RDF terms.
+        """
+        _dataset: Dataset = Dataset() if dataset is None else dataset
+        _graph_name = self.graph_name if graph_name is None else graph_name  # type: ignore[attr-defined]
+
+        if not _add_quads(_dataset, self, _graph_name, batch_size, trusted):
+            msg = f"No statements added to Dataset object '{_dataset}'. This might indicate an exhausted iterator."
+            warnings.warn(msg)
+
+        return _dataset
+
+
+def _add_quads(
+    dataset: Dataset,
+    statements: Iterable[Triple | Quad],
+    graph_name: GraphName | None = None,
+    batch_size: int = 10_000,
+    trusted: bool = False,
+) -> int:
+    """Add triples and quads to the named graphs of dataset in batches using Store.addN.
+
+    Named graph objects are created once per graph name and reused for all batches.
+    Returns the number of added statements.
+    """
+    graphs: dict[GraphName | None, Graph] = {None: dataset.default_graph}
+
+    def _graph(name: GraphName | None) -> Graph:
+        if (graph := graphs.get(name)) is None:
+            graph = graphs[name] = dataset.graph(name)
+        return graph
+
+    default = _graph(graph_name)
+    add_quads = dataset.store.addN
+    count = 0
+
+    for batch in itertools.batched(statements, batch_size):
+        quads = [
+            (*statement, default)
+            if len(statement) == 3
+            else (*statement[:3], _graph(statement[3]))  # type: ignore[misc]
+            for statement in batch
+        ]
+
+        if not trusted and not all(
+            isinstance(s, Node) and isinstance(p, Node) and isinstance(o, Node)
+            for s, p, o, _ in quads
+        ):
+            invalid = next(
+                statement
+                for statement in batch
+                if not all(isinstance(term, Node) for term in statement[:3])
+            )
+            raise TypeError(
+                f"Unable to add statement {invalid!r}. All triple terms must be rdflib terms."
+            )
+
+        add_quads(quads)
+        count += len(batch)
+
+    return count
+
+
+type TTripleSink = Graph | NTriplesWriter | Callable[[Sequence[Triple]], object]
+
+
+def fan_out(
+    triples: Iterable[Triple],
+    *sinks: TTripleSink,
+    batch_size: int = 10_000,
+    trusted: bool = False,
+) -> int:
+    """Consume triples once and pass every batch of triples to several sinks.
+
+    Sinks are rdflib.Graph objects (triples are added using the batched to_graph insertion path),
+    NTriplesWriter objects or callables that take a batch of triples, e.g. counters.
+    Every sink receives the same batch tuple and the same triple objects;
+    only a single batch is held in memory at any time.
+
+    Returns the total number of consumed triples.
+    """
+    consumers: list[Callable[[Sequence[Triple]], object]] = []
+
+    for sink in sinks:
+        match sink:
+            case Graph():
+                consumers.append(
+                    lambda batch, graph=sink: _add_triples(
+                        graph, batch, batch_size, trusted
+                    )
+                )
+            case NTriplesWriter():
+                consumers.append(sink.write)
+            case _ if callable(sink):
+                consumers.append(sink)
+            case _:
+                raise TypeError(
+                    f"Unable to process sink '{sink}'. "
+                    "Sinks must be rdflib.Graph, NTriplesWriter or callable objects."
+                )
+
+    count = 0
+
+    for batch in itertools.batched(triples, batch_size):
+        for consume in consumers:
+            consume(batch)
+        count += len(batch)
+
+    if not count:
+        msg = "No triples passed to sinks. This might indicate an exhausted iterator."
+        warnings.warn(msg)
+
+    return count
+
+
+class _BatchedMixin:
+    """Mixin that adds a batched method for chunked iteration over Iterable[_Triple] objects."""
+
+    def batched(self: Iterable[Triple], n: int) -> Iterator[tuple[Triple, ...]]:
+        """Generate tuples of n triples; the last tuple may be shorter."""
+        return itertools.batched(self, n)
+
+
+class _ToFileMixin:
+    """Mixin that adds a to_file method for streaming Iterable[_Triple] objects to N-Triples/N-Quads."""
+
+    def to_file(
+        self: Iterable[Triple],
+        destination: IO[bytes] | str | PurePath,
+        graph_name: URIRef | BNode | None = None,
+        batch_size: int = 10_000,
+    ) -> int:
+        """Stream triples to destination as N-Triples, or as N-Quads if a graph name applies.
+
+        The graph name defaults to the graph_name of the object (e.g. ttl(..., graph_name=...)).
+        """
+        _graph_name = (
+            getattr(self, "graph_name", None) if graph_name is None else graph_name
+        )
+        count = serialize_stream(self, destination, _graph_name, batch_size)
+
+        if not count:
+            msg = f"No triples written to '{destination}'. This might indicate an exhausted iterator."
+            warnings.warn(msg)
+
+        return count
@@ -19,6 +19,8 @@ __all__ = (
     "RDFTerm",
     "TripleObject",
     "Triple",
+    "GraphName",
+    "Quad",
     "LiteralObjectTriple",
     "URIObjectTriple",
     "BNodeObjectTriple",
@@ -35,6 +37,8 @@ type TriplePredicate = URIRef
 type RDFTerm = Literal | URIRef | BNode
 type TripleObject = RDFTerm
 type Triple = tuple[TripleSubject, URIRef, TripleObject]
+type GraphName = URIRef | BNode
+type Quad = tuple[TripleSubject, URIRef, TripleObject, GraphName | None]
 
 type LiteralObjectTriple = tuple[TripleSubject, URIRef, Literal]
 type URIObjectTriple = tuple[TripleSubject, URIRef, URIRef]
@@ -1,10 +1,32 @@
 """LODKit URIConstructor functionality."""
 
-from hashlib import sha256
-from uuid import uuid4
+import base64
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import hashlib
+import itertools
+import json
+from pathlib import PurePath
+import os
+import threading
+import time
+from typing import Any, Literal, NamedTuple
+from uuid import UUID, uuid4
 
 from rdflib import Namespace, URIRef
 
+type TSegmentEncoding = Literal["hex", "base32", "base64url"]
+type TFallback = Literal["uuid4", "uuid7", "counter"]
+
+
+class URICacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
 
 class URIConstructor:
     """Namespaced URI constructor.
@@ -15,20 +37,417 @@ class URIConstructor:
     If a hash_value argument of type str | bytes is provided, the URIRef
     will be generated with the sha256 hash of the hash_value argument as component;
     else a URIRef with a unique component will be generated using UUID4.
+
+    The fallback for calls without hash_value is configurable: "uuid4" (random, the default),
+    "uuid7" (time-ordered UUIDs, monotonic within a URIConstructor) or "counter"
+    (a zero-padded 16 digit hex sequence number); time-ordered and counter components
+    sort in minting order, so they append to ordered store indexes instead of scattering.
+    If a fallback_prefix is given, fallback components are prefixed with "{fallback_prefix}-",
+    e.g. a worker or process id so that parallel workers never collide.
+    Counters are shared by all URIConstructors of the same namespace and fallback_prefix in a process;
+    since counters start at 0 in every process, a restarted worker with the same fallback_prefix
+    must pass fallback_start (e.g. the number of components minted in previous runs)
+    to continue the sequence instead of repeating it.
+
+    The hash component is configurable: digest is any hashlib algorithm name
+    (digest_size is passed to blake2b/blake2s and determines the output length of shake digests, at least 1 byte),
+    encoding is one of "hex", "base32" (lowercase) or "base64url" (both unpadded)
+    and length truncates the encoded component to length characters
+    (between 1 and the length of the encoded digest).
+    Minted URIs are deterministic for any given configuration.
+
+    URIConstructor.many mints URIRefs for an iterable of hash values in bulk.
+
+    If cache_size is given, URIRefs for hash values are memoized in a bounded LRU cache
+    of cache_size entries; see URIConstructor.cache_info, URIConstructor.warm
+    and URIConstructor.dump_cache/URIConstructor.load_cache for persisting the cache between runs.
     """
 
     def __init__(
         self,
         namespace: str,
+        cache_size: int | None = None,
+        digest: str = "sha256",
+        digest_size: int | None = None,
+        encoding: TSegmentEncoding = "hex",
+        length: int | None = None,
+        fallback: TFallback = "uuid4",
+        fallback_prefix: str | None = None,
+        fallback_start: int | None = None,
     ) -> None:
         self.namespace = Namespace(namespace)
+        self._prefix: str = str(namespace)
+
+        self.digest = digest
+        self.digest_size = digest_size
+        self.encoding = encoding
+        self.length = length
+        self.fallback = fallback
+        self.fallback_prefix = fallback_prefix
+        self._segment: Callable[[str | bytes | None], str] = _segment_function(
+            digest,
+            digest_size,
+            encoding,
+            length,
+            _fallback_function(fallback, fallback_prefix, self._prefix, fallback_start),
+        )
+
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str | bytes, URIRef] | None = (
+            None if cache_size is None else OrderedDict()
+        )
+        self._hits: int = 0
+        self._misses: int = 0
 
     def __call__(self, hash_value: str | bytes | None = None) -> URIRef:
-        if hash_value is None:
-            segment = str(uuid4())
-        else:
+        if self._cache is None or hash_value is None:
+            return URIRef(self._prefix + self._segment(hash_value))
+
+        try:
+            uri = self._cache[hash_value]
+        except KeyError:
+            self._misses += 1
+            return self._cache_uri(hash_value)
+
+        self._hits += 1
+        self._cache.move_to_end(hash_value)
+        return uri
+
+    def many(
+        self,
+        hash_values: Iterable[str | bytes | None],
+        max_workers: int | None = None,
+        chunk_size: int = 10_000,
+    ) -> Iterator[URIRef]:
+        """Generate a URIRef for every hash value in hash_values (in order).
+
+        URIRefs are constructed directly from the namespace prefix string,
+        skipping the per-call Namespace lookup of URIConstructor.__call__.
+
+        If max_workers is given, hash values are minted in chunks of chunk_size values
+        in a thread pool of max_workers threads; since hashlib releases the GIL
+        for large inputs, this mainly speeds up minting from large payloads.
+        At most 2 * max_workers chunks are pending at any time.
+        Note that the URI cache is only used if max_workers is None and that
+        URIs are always minted serially for the ordered "uuid7" and "counter" fallbacks,
+        so fallback components follow the output order.
+        """
+        if max_workers is None and self._cache is not None:
+            return map(self, hash_values)
+
+        if max_workers is None or self.fallback != "uuid4":
+            prefix, segment = self._prefix, self._segment
+            return (URIRef(prefix + segment(value)) for value in hash_values)
+
+        return self._many_threaded(hash_values, max_workers, chunk_size)
+
+    def cache_info(self) -> URICacheInfo:
+        """Return hit/miss statistics and the size of the URI cache."""
+        cache = self._require_cache()
+        return URICacheInfo(self._hits, self._misses, self.cache_size, len(cache))  # type: ignore[arg-type]
+
+    def warm(self, hash_values: Iterable[str | bytes]) -> None:
+        """Pre-populate the URI cache with hash values without affecting hit/miss statistics."""
+        self._require_cache()
+
+        for hash_value in hash_values:
+            self._cache_uri(hash_value)
+
+    def dump_cache(self, path: str | PurePath) -> None:
+        """Persist the URI cache table (in LRU order) to a JSON file."""
+        cache = self._require_cache()
+
+        entries: list[tuple[str, str, str]] = []
+
+        for key, uri in cache.items():
+            segment = uri.removeprefix(self._prefix)
+
+            if isinstance(key, bytes):
+                entries.append(
+                    ("bytes", base64.b64encode(key).decode("ascii"), segment)
+                )
+            else:
+                entries.append(("str", key, segment))
+
+        with open(path, "w") as f:
+            json.dump({"config": self._config(), "entries": entries}, f)
+
+    def load_cache(self, path: str | PurePath) -> None:
+        """Load a URI cache table persisted with URIConstructor.dump_cache.
+
+        Raises a ValueError if the table was persisted by a URIConstructor with a different configuration.
+        """
+        cache = self._require_cache()
+
+        with open(path) as f:
+            table = json.load(f)
+
+        if table["config"] != self._config():
+            raise ValueError(
+                f"Unable to load URI cache '{path}'. "
+                f"The cache was persisted for configuration {table['config']}, "
+                f"expected {self._config()}."
+            )
+
+        for kind, key, segment in table["entries"]:
+            hash_value = base64.b64decode(key) if kind == "bytes" else key
+            cache[hash_value] = URIRef(self._prefix + segment)
+            cache.move_to_end(hash_value)
+
+        self._evict()
+
+    def _cache_uri(self, hash_value: str | bytes) -> URIRef:
+        uri = self._cache[hash_value] = URIRef(  # type: ignore[index]
+            self._prefix + self._segment(hash_value)
+        )
+        self._evict()
+        return uri
+
+    def _evict(self) -> None:
+        while len(self._cache) > self.cache_size:  # type: ignore[arg-type, operator]
+            self._cache.popitem(last=False)  # type: ignore[union-attr]
+
+    def _require_cache(self) -> OrderedDict[str | bytes, URIRef]:
+        if self._cache is None:
+            raise ValueError(
+                "URI caching is disabled. Initialize URIConstructor with a cache_size."
+            )
+        return self._cache
+
+    def _config(self) -> dict[str, Any]:
+        """Return the URIConstructor configuration that determines minted URIs."""
+        return {
+            "namespace": self._prefix,
+            "digest": self.digest,
+            "digest_size": self.digest_size,
+            "encoding": self.encoding,
+            "length": self.length,
+        }
+
+    def _many_threaded(
+        self,
+        hash_values: Iterable[str | bytes | None],
+        max_workers: int,
+        chunk_size: int,
+    ) -> Iterator[URIRef]:
+        chunks = itertools.batched(hash_values, chunk_size)
+        pending: deque[Future[list[URIRef]]] = deque()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk in chunks:
+                pending.append(executor.submit(self._mint, chunk))
+
+                if len(pending) >= 2 * max_workers:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+    def _mint(self, hash_values: Iterable[str | bytes | None]) -> list[URIRef]:
+        prefix, segment = self._prefix, self._segment
+        return [URIRef(prefix + segment(value)) for value in hash_values]
+
+
+def _segment_function(
+    digest: str,
+    digest_size: int | None,
+    encoding: TSegmentEncoding,
+    length: int | None,
+    fallback: Callable[[], str],
+) -> Callable[[str | bytes | None], str]:
+    """Compose a function that computes the URI component for a hash value.
+
+    Hash values are hashed with digest, encoded and truncated to length characters;
+    if the hash value is None, the component is obtained from fallback.
+
+    Raises a ValueError for unsupported digest configurations, encodings
+    or lengths outside of 1 and the length of the encoded digest.
+    """
+    if (encode := _ENCODINGS.get(encoding)) is None:
+        raise ValueError(
+            f"Unsupported segment encoding '{encoding}'. "
+            f"Encodings must be one of {', '.join(map(repr, _ENCODINGS))}."
+        )
+
+    if digest.startswith("shake_"):
+        size = 32 if digest_size is None else digest_size
+
+        if size < 1:
+            raise ValueError(
+                f"Unsupported digest configuration: '{digest}' with digest_size={digest_size}. "
+                "Shake digest sizes must be at least 1."
+            )
+
+        def _digest(hash_value: bytes) -> bytes:
+            return hashlib.new(digest, hash_value).digest(size)  # type: ignore[call-arg]
+
+    else:
+        constructor = getattr(hashlib, digest, None) or functools.partial(
+            hashlib.new, digest
+        )
+        if digest_size is not None:
+            constructor = functools.partial(constructor, digest_size=digest_size)
+
+        def _digest(hash_value: bytes) -> bytes:
+            return constructor(hash_value).digest()
+
+    if encoding == "hex" and length is None and not digest.startswith("shake_"):
+
+        def _segment(hash_value: str | bytes | None) -> str:  # default fast path
+            if hash_value is None:
+                return fallback()
+            if isinstance(hash_value, str):
+                hash_value = hash_value.encode("utf8")
+            return constructor(hash_value).hexdigest()
+
+    else:
+
+        def _segment(hash_value: str | bytes | None) -> str:
+            if hash_value is None:
+                return fallback()
             if isinstance(hash_value, str):
                 hash_value = hash_value.encode("utf8")
-            segment = sha256(hash_value).hexdigest()
+            return encode(_digest(hash_value))[:length]
+
+    try:
+        _segment(b"")
+    except TypeError:
+        raise ValueError(
+            f"Unsupported digest configuration: '{digest}' with digest_size={digest_size}."
+        ) from None
+
+    encoded_length = len(encode(_digest(b"")))
+
+    if length is not None and not 1 <= length <= encoded_length:
+        raise ValueError(
+            f"Unsupported segment length {length}. "
+            f"Lengths must be between 1 and the encoded digest length {encoded_length}."
+        )
+
+    return _segment
+
+
+def _fallback_function(
+    fallback: TFallback,
+    fallback_prefix: str | None,
+    namespace: str,
+    fallback_start: int | None,
+) -> Callable[[], str]:
+    """Return a function that computes unique URI components for calls without hash value.
+
+    Raises a ValueError for unsupported fallback modes or if fallback_start is given
+    for a fallback other than "counter".
+    """
+    if fallback_start is not None and fallback != "counter":
+        raise ValueError("fallback_start is only supported for fallback='counter'.")
+
+    component = _fallback_component(
+        fallback, fallback_prefix, namespace, fallback_start
+    )
+
+    if fallback_prefix is None:
+        return component
+
+    return lambda: f"{fallback_prefix}-{component()}"
+
+
+def _fallback_component(
+    fallback: TFallback,
+    fallback_prefix: str | None,
+    namespace: str,
+    fallback_start: int | None,
+) -> Callable[[], str]:
+    match fallback:
+        case "uuid4":
+            return lambda: str(uuid4())
+        case "uuid7":
+            return _uuid7_function()
+        case "counter":
+            counter = _shared_counter(namespace, fallback_prefix, fallback_start or 0)
+            return lambda: f"{counter():016x}"
+        case _:
+            raise ValueError(
+                f"Unsupported fallback '{fallback}'. "
+                "Fallbacks must be one of 'uuid4', 'uuid7' or 'counter'."
+            )
+
+
+class _SequenceCounter:
+    """Thread-safe counter that can be advanced to a start value."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def __call__(self) -> int:
+        with self._lock:
+            value = self._next
+            self._next += 1
+        return value
+
+    def advance(self, start: int) -> None:
+        with self._lock:
+            self._next = max(self._next, start)
+
+
+_counters: dict[tuple[str, str | None], _SequenceCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def _shared_counter(
+    namespace: str, fallback_prefix: str | None, start: int
+) -> _SequenceCounter:
+    """Return the process-wide counter for namespace and fallback_prefix, advanced to at least start."""
+    if start < 0:
+        raise ValueError(f"Unsupported fallback_start {start}. Starts must be >= 0.")
+
+    with _counters_lock:
+        counter = _counters.setdefault((namespace, fallback_prefix), _SequenceCounter())
+
+    counter.advance(start)
+    return counter
+
+
+def _uuid7_function() -> Callable[[], str]:
+    """Return a function that generates monotonic UUIDv7 strings (RFC 9562).
+
+    UUIDs carry a 48 bit Unix timestamp in milliseconds; the 12 bit rand_a field is used
+    as a sequence counter that is incremented for UUIDs minted within the same millisecond
+    (and that advances the timestamp on overflow), so generated UUIDs are strictly increasing.
+    """
+    lock = threading.Lock()
+    last_ms, sequence = -1, 0
+
+    def _uuid7() -> str:
+        nonlocal last_ms, sequence
+
+        with lock:
+            now_ms = time.time_ns() // 1_000_000
+
+            if now_ms > last_ms:
+                last_ms, sequence = now_ms, 0
+            elif sequence < 0xFFF:
+                sequence += 1
+            else:
+                last_ms, sequence = last_ms + 1, 0
+
+            timestamp, counter = last_ms, sequence
+
+        rand_b = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+        value = (
+            (timestamp & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | counter << 64
+            | 0b10 << 62
+            | rand_b
+        )
+        return str(UUID(int=value))
+
+    return _uuid7
+
 
-        return self.namespace[segment]
+_ENCODINGS: dict[str, Callable[[bytes], str]] = {
+    "hex": bytes.hex,
+    "base32": lambda raw: base64.b32encode(raw).decode("ascii").rstrip("=").lower(),
+    "base64url": lambda raw: base64.urlsafe_b64encode(raw).decode("ascii").rstrip("="),
+}
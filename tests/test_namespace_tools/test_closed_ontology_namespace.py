@@ -1,5 +1,9 @@
 """Pytest entry point for ClosedOntologyNamespace tests."""
 
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import time
+
 import pytest
 from rdflib import RDF, RDFS, Graph, URIRef
 
@@ -119,6 +123,26 @@ def test_closed_ns_no_solution():
         ClosedOntologyNamespace(source=g)
 
 
+def test_closed_ns_non_iri_and_empty_names():
+    """Check that blank node subjects and IRIs with empty names are not registered."""
+    data = """
+    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+    [] a rdfs:Class .
+    <https://example.com/ontology/> a rdfs:Class .
+    """
+    g = Graph().parse(data=data, format="ttl")
+
+    with pytest.raises(NoSolutionException):
+        ClosedOntologyNamespace(source=g)
+
+    g.add((URIRef("https://example.com/ontology/s"), RDF.type, RDFS.Class))
+
+    assert ClosedOntologyNamespace(source=g).mapping == {
+        "s": URIRef("https://example.com/ontology/s")
+    }
+
+
 def test_closed_ns_attribute_error():
     """Check that attribute and getitem access failure results in an AttributeError."""
 
@@ -134,3 +158,56 @@ def test_closed_ns_attribute_error():
 
     with pytest.raises(AttributeError):
         ns["dne"]
+
+
+def test_closed_ns_cache(tmp_path, monkeypatch):
+    """Check that cached mappings are loaded without parsing and invalidated on source changes."""
+    source = tmp_path / "ontology.ttl"
+    source.write_text("<urn:s1> a <http://www.w3.org/2000/01/rdf-schema#Class> .")
+    cache_dir = tmp_path / "cache"
+
+    ns = ClosedOntologyNamespace(source, format="ttl", cache_dir=cache_dir)
+
+    assert len(list(cache_dir.iterdir())) == 1
+
+    with monkeypatch.context() as m:
+        m.setattr(Graph, "parse", lambda *args, **kwargs: pytest.fail("parsed"))
+        cached = ClosedOntologyNamespace(source, format="ttl", cache_dir=cache_dir)
+
+    assert cached.mapping == ns.mapping == {"s1": URIRef("urn:s1")}
+
+    source.write_text("<urn:s22> a <http://www.w3.org/2000/01/rdf-schema#Class> .")
+
+    assert ClosedOntologyNamespace(source, format="ttl", cache_dir=cache_dir).s22
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_closed_ns_lazy(tmp_path, monkeypatch):
+    """Check that lazy namespaces parse once on first access, also for concurrent accesses."""
+    source = tmp_path / "ontology.ttl"
+    source.write_text("<urn:s> a <http://www.w3.org/2000/01/rdf-schema#Class> .")
+    parse, calls = Graph.parse, []
+
+    def _parse(self, *args, **kwargs):
+        calls.append(args)
+        time.sleep(0.05)
+        return parse(self, *args, **kwargs)
+
+    monkeypatch.setattr(Graph, "parse", _parse)
+
+    ns = ClosedOntologyNamespace(source, format="ttl", lazy=True)
+    assert not calls
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        uris = list(executor.map(lambda _: ns.s, range(8)))
+
+    assert uris == [URIRef("urn:s")] * 8
+    assert len(calls) == 1
+    assert ns.mapping == copy.copy(ns).mapping == {"s": URIRef("urn:s")}
+
+
+def test_closed_ns_lazy_no_solution():
+    ns = ClosedOntologyNamespace(Graph(), lazy=True)
+
+    with pytest.raises(NoSolutionException):
+        ns.mapping
@@ -0,0 +1,159 @@
+"""Pytest entry point for static namespace module generation tests."""
+
+import importlib.util
+import warnings
+from types import MappingProxyType, ModuleType
+
+import pytest
+from rdflib import Graph, URIRef
+
+from lodkit import generate_namespace_module, write_namespace_module
+from lodkit.namespace_tools.codegen import main
+
+data = """
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+
+<urn:ex:Person> a owl:Class .
+<urn:ex:E52_Time-Span> a rdfs:Class .
+<urn:ex:name> a owl:DatatypeProperty .
+<urn:ex:class> a owl:ObjectProperty .
+<urn:ex:mapping> a owl:AnnotationProperty .
+"""
+
+expected_mapping = {
+    "Person": URIRef("urn:ex:Person"),
+    "E52_Time-Span": URIRef("urn:ex:E52_Time-Span"),
+    "name": URIRef("urn:ex:name"),
+    "class": URIRef("urn:ex:class"),
+    "mapping": URIRef("urn:ex:mapping"),
+}
+
+
+def _import_module(path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+@pytest.fixture
+def ontology(tmp_path):
+    path = tmp_path / "ontology.ttl"
+    path.write_text(data)
+    return path
+
+
+def test_write_namespace_module(ontology, tmp_path):
+    """Check generated module constants, item lookup and mapping."""
+    path = tmp_path / "vocab.py"
+    write_namespace_module(ontology, path, format="ttl", class_name="Ex", name="ex")
+
+    module = _import_module(path)
+    ex = module.ex
+
+    assert isinstance(ex, module.Ex)
+    assert ex.Person == URIRef("urn:ex:Person")
+    assert isinstance(ex.name, URIRef)
+    assert ex["E52_Time-Span"] == URIRef("urn:ex:E52_Time-Span")
+    assert ex["class"] == URIRef("urn:ex:class")
+
+    assert isinstance(ex.mapping, MappingProxyType)
+    assert ex["mapping"] == URIRef("urn:ex:mapping")
+    assert ex.mapping == expected_mapping
+
+
+def test_generated_namespace_closed(ontology, tmp_path):
+    """Check that generated namespaces are read-only and closed."""
+    path = tmp_path / "vocab.py"
+    write_namespace_module(ontology, path, format="ttl")
+
+    namespace = _import_module(path).namespace
+
+    with pytest.raises(AttributeError):
+        namespace.Person = URIRef("urn:ex:other")
+
+    with pytest.raises(AttributeError):
+        namespace.dunno
+
+    with pytest.raises(AttributeError):
+        namespace["dunno"]
+
+
+def test_generate_namespace_stub():
+    """Check that the .pyi stub declares identifier members only."""
+    graph = Graph().parse(data=data, format="ttl")
+    module, stub = generate_namespace_module(graph, class_name="Ex", name="ex")
+
+    assert "    Person: _Final[_URIRef]" in stub
+    assert "    name: _Final[_URIRef]" in stub
+    assert "ex: _Final[Ex]" in stub
+    assert "Time-Span" not in stub
+    assert "class:" not in stub
+
+    compile(module, "<generated>", "exec")
+    compile(stub, "<generated>", "exec")
+
+
+def test_codegen_cli(ontology, tmp_path):
+    """Check that the codegen CLI writes the module and its stub."""
+    path = tmp_path / "cli_vocab.py"
+    main([str(ontology), str(path), "--format", "ttl", "--name", "ex"])
+
+    assert path.with_suffix(".pyi").exists()
+    assert _import_module(path).ex.Person == URIRef("urn:ex:Person")
+
+
+def test_generated_namespace_shadowing_terms(tmp_path):
+    """Check that terms named like names used in the generated module do not break it."""
+    terms = ["URIRef", "MappingProxyType", "str", "Final", "_URIRef", "AttributeError"]
+    graph = Graph().parse(
+        data="\n".join(
+            f"<urn:ex:{term}> a <http://www.w3.org/2002/07/owl#Class> ."
+            for term in terms
+        ),
+        format="ttl",
+    )
+    path = tmp_path / "shadowing.py"
+    write_namespace_module(graph, path, name="ex")
+
+    ex = _import_module(path).ex
+
+    assert ex.URIRef == URIRef("urn:ex:URIRef")
+    assert ex.MappingProxyType == URIRef("urn:ex:MappingProxyType")
+    assert ex["_URIRef"] == URIRef("urn:ex:_URIRef")
+    assert isinstance(ex.mapping, MappingProxyType)
+
+    with pytest.raises(AttributeError):
+        ex["dunno"]
+
+    compile(path.with_suffix(".pyi").read_text(), "<stub>", "exec")
+
+
+def test_generated_namespace_source_label(tmp_path):
+    """Check that source paths are escaped in the generated module docstring."""
+    source = tmp_path / 'C:\\vocab\\"""onto.ttl'
+    source.write_text(data)
+    module, _ = generate_namespace_module(source, format="ttl")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        namespace = {}
+        exec(compile(module, "<generated>", "exec"), namespace)
+
+    assert str(source) in namespace["__doc__"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"class_name": "Invalid-Name"},
+        {"name": "class"},
+        {"class_name": "ex", "name": "ex"},
+    ],
+)
+def test_generate_namespace_invalid_identifiers(kwargs):
+    graph = Graph().parse(data=data, format="ttl")
+
+    with pytest.raises(ValueError):
+        generate_namespace_module(graph, **kwargs)
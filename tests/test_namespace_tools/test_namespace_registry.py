@@ -0,0 +1,95 @@
+"""Pytest entry point for NamespaceRegistry tests."""
+
+import pytest
+from rdflib import Graph, URIRef
+
+from lodkit import (
+    ClosedOntologyNamespace,
+    NamespaceConflicts,
+    NamespaceRegistry,
+    ResolvedURI,
+)
+
+data = """
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+
+<urn:a:Person> a owl:Class .
+<urn:a:label> a owl:AnnotationProperty .
+<urn:shared:Place> a owl:Class .
+"""
+
+
+@pytest.fixture
+def registry():
+    namespace_a = ClosedOntologyNamespace(Graph().parse(data=data, format="ttl"))
+    mapping_b = {
+        "label": URIRef("urn:b:label"),
+        "Place": URIRef("urn:shared:Place"),
+        "Location": URIRef("urn:shared:Place"),
+    }
+
+    return NamespaceRegistry({"a": namespace_a, "b": mapping_b})
+
+
+def test_namespace_registry_resolve(registry):
+    """Check reverse lookup of registered URIs."""
+    assert registry.resolve(URIRef("urn:a:Person")) == ResolvedURI("a", "Person")
+    assert registry.resolve(URIRef("urn:b:label")) == ("b", "label")
+    assert registry.get(URIRef("urn:a:label")) == ResolvedURI("a", "label")
+
+    assert registry.get(URIRef("urn:dunno")) is None
+
+    with pytest.raises(KeyError):
+        registry.resolve(URIRef("urn:dunno"))
+
+
+def test_namespace_registry_contains(registry):
+    """Check URIRef membership across registered namespaces."""
+    assert registry.contains(URIRef("urn:a:Person"))
+    assert registry.contains(URIRef("urn:b:label"))
+    assert not registry.contains(URIRef("urn:dunno"))
+
+
+def test_namespace_registry_mapping_access(registry):
+    """Check access to the registered namespace mappings."""
+    assert list(registry) == ["a", "b"]
+    assert len(registry) == 2
+    assert "a" in registry
+    assert "c" not in registry
+    assert URIRef("urn:a:Person") not in registry
+    assert registry["a"]["Person"] == URIRef("urn:a:Person")
+    assert registry["b"]["Location"] == URIRef("urn:shared:Place")
+
+
+def test_namespace_registry_conflicts(registry):
+    """Check reporting of duplicate names and URIs."""
+    conflicts = registry.conflicts()
+
+    assert isinstance(conflicts, NamespaceConflicts)
+    assert conflicts.names == {"label": ("a", "b"), "Place": ("a", "b")}
+    assert conflicts.uris == {
+        URIRef("urn:shared:Place"): (
+            ResolvedURI("a", "Place"),
+            ResolvedURI("b", "Place"),
+            ResolvedURI("b", "Location"),
+        )
+    }
+
+    # the first registration is resolved
+    assert registry.resolve(URIRef("urn:shared:Place")) == ("a", "Place")
+
+
+def test_namespace_registry_no_conflicts():
+    """Check that disjoint namespaces report no conflicts."""
+    registry = NamespaceRegistry({"a": {"x": URIRef("urn:a:x")}})
+    registry.register("b", {"y": URIRef("urn:b:y")})
+
+    assert registry.conflicts() == NamespaceConflicts(names={}, uris={})
+
+
+def test_namespace_registry_duplicate_ontology():
+    """Check that registering an ontology key twice raises a ValueError."""
+    registry = NamespaceRegistry({"a": {"x": URIRef("urn:a:x")}})
+
+    with pytest.raises(ValueError):
+        registry.register("a", {"y": URIRef("urn:a:y")})
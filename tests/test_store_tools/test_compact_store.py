@@ -0,0 +1,142 @@
+"""Pytest entry point for lodkit CompactStore tests."""
+
+import itertools
+import sys
+
+import pytest
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.compare import isomorphic
+
+from lodkit import CompactStore, RDFImporter, TripleChain, enable_rdf_import, ttl
+
+ex = Namespace("https://example.com/")
+
+triples = TripleChain(
+    *(
+        ttl(
+            ex[f"s{i}"],
+            (ex.p, ex[f"o{i % 3}"], str(i % 2)),
+            (ex[f"p{i % 2}"], ex.s0, Literal(i)),
+        )
+        for i in range(10)
+    )
+)
+reference = Graph()
+reference.addN((s, p, o, reference) for s, p, o in triples)
+
+terms = [ex.s0, ex.p, ex.p1, ex.o1, Literal("1"), ex.unknown, None]
+
+
+@pytest.fixture
+def compact_graph():
+    return TripleChain(reference).to_graph(store="LODKitCompact")
+
+
+@pytest.mark.parametrize("pattern", itertools.product(terms, repeat=3))
+def test_compact_store_patterns(compact_graph, pattern):
+    """Check that all triple patterns match the same triples as in rdflib's Memory store."""
+    assert set(compact_graph.triples(pattern)) == set(reference.triples(pattern))
+
+
+def test_compact_store_deduplicates(compact_graph):
+    compact_graph.addN((s, p, o, compact_graph) for s, p, o in reference)
+    compact_graph.add((ex.s0, ex.p, ex.new))
+
+    assert len(compact_graph) == len(reference) + 1
+    assert isomorphic(compact_graph - Graph().add((ex.s0, ex.p, ex.new)), reference)
+
+
+def test_compact_store_remove(compact_graph):
+    compact_graph.remove((None, ex.p, None))
+
+    assert not list(compact_graph.triples((None, ex.p, None)))
+    assert len(compact_graph) == len(reference) - len(
+        list(reference.triples((None, ex.p, None)))
+    )
+
+
+def test_compact_store_interleaved_additions(compact_graph):
+    """Check lookups interleaved with single additions, removals and bulk additions."""
+    graph = Graph()
+    graph.addN((s, p, o, graph) for s, p, o in reference)
+    patterns = [(ex.s0, None, None), (None, ex.p, None), (None, None, ex.s0)]
+
+    for pattern in patterns:  # build POS and OSP permutations
+        list(compact_graph.triples(pattern))
+
+    for i in range(40):
+        triple = (ex[f"s{i % 12}"], ex.p, ex[f"o{i % 5}"])
+
+        if triple not in compact_graph:
+            compact_graph.add(triple)
+        graph.add(triple)
+
+        if i % 10 == 0:
+            compact_graph.remove((ex[f"s{i % 12}"], None, None))
+            graph.remove((ex[f"s{i % 12}"], None, None))
+
+        for pattern in [*patterns, triple]:
+            assert set(compact_graph.triples(pattern)) == set(graph.triples(pattern))
+
+    bulk = [(ex[f"s{i}"], ex.p2, ex.s0) for i in range(200)]
+    compact_graph.addN((s, p, o, compact_graph) for s, p, o in bulk * 2)
+    graph.addN((s, p, o, graph) for s, p, o in bulk)
+
+    assert len(compact_graph) == len(graph)
+    for pattern in patterns:
+        assert set(compact_graph.triples(pattern)) == set(graph.triples(pattern))
+
+
+def test_compact_store_single_removals(compact_graph):
+    """Check single removals, re-adding removed triples and purging removed rows."""
+    graph = Graph()
+    graph.addN((s, p, o, graph) for s, p, o in reference)
+    patterns = [(ex.s0, None, None), (None, ex.p, None), (None, None, ex.s0)]
+
+    for i in range(30):
+        for g in (compact_graph, graph):
+            g.set((ex[f"s{i % 10}"], ex.p, ex[f"o{i % 4}"]))
+            g.remove((ex[f"s{(i + 1) % 10}"], ex.p0, None))
+
+        if i == 15:  # re-add removed triples through the merge path
+            compact_graph.addN((s, p, o, compact_graph) for s, p, o in reference)
+            graph.addN((s, p, o, graph) for s, p, o in reference)
+
+        assert len(compact_graph) == len(graph)
+        for pattern in [*patterns, (None, None, None)]:
+            assert set(compact_graph.triples(pattern)) == set(graph.triples(pattern))
+
+    compact_graph.remove((None, None, None))
+
+    assert len(compact_graph) == 0
+    assert not compact_graph.store._removed
+
+    compact_graph.add((ex.s0, ex.p, ex.o0))
+    assert set(compact_graph) == {(ex.s0, ex.p, ex.o0)}
+
+
+def test_compact_store_namespaces():
+    graph = Graph(store=CompactStore())
+    graph.bind("ex", ex)
+
+    assert graph.store.namespace("ex") == URIRef(ex)
+    assert graph.store.prefix(URIRef(ex)) == "ex"
+
+
+def test_compact_store_rdf_import():
+    _sys_meta_path = sys.meta_path.copy()
+
+    try:
+        enable_rdf_import(store="LODKitCompact")
+        from tests.data.graphs import ttl_graph
+
+        assert isinstance(ttl_graph.store, CompactStore)
+        assert len(ttl_graph)
+    finally:
+        sys.meta_path = _sys_meta_path
+
+        for key in list(sys.modules.keys()):
+            if key.startswith("tests.data"):
+                del sys.modules[key]
+
+    assert not any(isinstance(entry, RDFImporter) for entry in sys.meta_path)
@@ -0,0 +1,81 @@
+"""Pytest entry point for lodkit SQLiteStore tests."""
+
+import asyncio
+
+import pytest
+from rdflib import XSD, Graph, Literal, Namespace, URIRef
+from rdflib.compare import isomorphic
+
+from lodkit import AsyncTripleChain, SQLiteStore, TripleChain, ttl
+
+ex = Namespace("https://example.com/")
+
+triples = ttl(
+    ex.s,
+    (ex.p, ex.o, "literal", Literal("literal", lang="en")),
+    (ex.p2, Literal(1), Literal("2", datatype=XSD.decimal)),
+    (ex.p3, [(ex.p4, ex.o)], ("1", "2")),
+)
+
+
+def test_to_graph_sqlite_reopen(tmp_path):
+    """Check that a graph built with to_graph(store=...) can be reopened from disk."""
+    path = tmp_path / "graph.db"
+
+    graph = TripleChain(triples).to_graph(store=f"sqlite:///{path}")
+    graph.close()
+
+    reopened = Graph(store=SQLiteStore(path))
+
+    assert isomorphic(reopened, triples.to_graph())
+
+
+def test_sqlite_store_plugin(tmp_path):
+    graph = Graph(store="LODKitSQLite")
+    graph.open(str(tmp_path / "graph.db"), create=True)
+    graph.bind("ex", ex)
+
+    triples.to_graph(graph=graph)
+
+    assert len(graph) == len(triples.to_graph())
+    assert graph.store.namespace("ex") == URIRef(ex)
+    assert set(graph.objects(ex.s, ex.p)) == {
+        ex.o,
+        Literal("literal"),
+        Literal("literal", lang="en"),
+    }
+    assert set(graph.subjects(ex.p4, ex.o)) < set(graph.objects(ex.s, ex.p3))
+    assert not list(graph.triples((ex.unknown, None, None)))
+
+
+def test_sqlite_store_deduplicates_and_removes(tmp_path):
+    skolemized = ttl(ex.s, *triples.predicate_object_pairs, skolemize=True)
+    graph = TripleChain(skolemized, skolemized).to_graph(
+        store=f"sqlite:///{tmp_path / 'graph.db'}"
+    )
+
+    assert len(graph) == len(triples.to_graph())
+
+    graph.remove((ex.s, ex.p, None))
+
+    assert not list(graph.objects(ex.s, ex.p))
+    assert list(graph.objects(ex.s, ex.p2))
+
+
+def test_sqlite_store_open_missing(tmp_path):
+    assert Graph(store=SQLiteStore()).open(str(tmp_path / "missing.db")) == -1
+
+
+def test_to_graph_graph_and_store():
+    with pytest.raises(ValueError):
+        triples.to_graph(graph=Graph(), store="LODKitSQLite")
+
+
+def test_async_to_graph_sqlite(tmp_path):
+    graph = asyncio.run(
+        AsyncTripleChain(triples).to_graph(
+            store=f"sqlite:///{tmp_path / 'graph.db'}", batch_size=2
+        )
+    )
+
+    assert isomorphic(graph, triples.to_graph())
@@ -0,0 +1,105 @@
+"""Pytest entry point for lodkit.AsyncTripleChain tests."""
+
+import asyncio
+from collections.abc import AsyncIterator
+import io
+import time
+
+import pytest
+from rdflib import Graph, Namespace
+from rdflib.compare import isomorphic
+
+from lodkit import AsyncTripleChain, ttl
+from lodkit.types import Triple
+
+ex = Namespace("https://example.com/")
+
+t1 = ttl(ex.s, (ex.p, ex.o))
+t2 = ttl(ex.s, (ex.p2, ex.o2))
+t3 = ttl(ex.s, (ex.p3, ex.o3))
+
+
+async def agenerate(triples) -> AsyncIterator[Triple]:
+    for triple in triples:
+        await asyncio.sleep(0)
+        yield triple
+
+
+def generate_chain_params() -> list:
+    return [
+        lambda: AsyncTripleChain(t1, agenerate(t2), t3),
+        lambda: AsyncTripleChain(agenerate(t1)).chain(t2, agenerate(t3)),
+        lambda: AsyncTripleChain().chain(t1).chain(agenerate(t2)).chain(t3),
+    ]
+
+
+async def _alist(aiterable):
+    return [item async for item in aiterable]
+
+
+@pytest.mark.parametrize("make_chain", generate_chain_params())
+def test_async_triple_chain(make_chain):
+    triples = ttl(ex.s, (ex.p, ex.o), (ex.p2, ex.o2), (ex.p3, ex.o3))
+    assert asyncio.run(_alist(make_chain())) == list(triples)
+
+
+@pytest.mark.parametrize("make_chain", generate_chain_params())
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+def test_async_triple_chain_to_graph(make_chain, batch_size):
+    triples = ttl(ex.s, (ex.p, ex.o), (ex.p2, ex.o2), (ex.p3, ex.o3))
+    graph = asyncio.run(make_chain().to_graph(batch_size=batch_size))
+
+    assert isomorphic(graph, triples.to_graph())
+
+
+@pytest.mark.parametrize("make_chain", generate_chain_params())
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+def test_async_triple_chain_to_file(make_chain, batch_size):
+    triples = ttl(ex.s, (ex.p, ex.o), (ex.p2, ex.o2), (ex.p3, ex.o3))
+    buffer = io.BytesIO()
+    count = asyncio.run(make_chain().to_file(buffer, batch_size=batch_size))
+
+    graph = Graph().parse(data=buffer.getvalue(), format="nt")
+
+    assert count == 3
+    assert isomorphic(graph, triples.to_graph())
+
+
+def test_async_triple_chain_exhaustion(tmp_path):
+    async def _exhaust():
+        chain = AsyncTripleChain(t1, agenerate(t2))
+
+        assert await chain.to_graph()
+
+        with pytest.warns(UserWarning):
+            await chain.to_graph()
+
+        with pytest.warns(UserWarning):
+            await chain.to_file(tmp_path / "empty.nt")
+
+    asyncio.run(_exhaust())
+
+
+def test_async_source_error_awaits_pending_batch():
+    """Check that a failing source does not leave a batch being written in a worker thread."""
+
+    class SlowBuffer(io.BytesIO):
+        def write(self, data):
+            time.sleep(0.05)
+            return super().write(data)
+
+    async def afailing() -> AsyncIterator[Triple]:
+        for triple in t1:
+            yield triple
+        await asyncio.sleep(0)
+        raise RuntimeError("source failed")
+
+    async def main() -> bytes:
+        buffer = SlowBuffer()
+
+        with pytest.raises(RuntimeError):
+            await AsyncTripleChain(afailing()).to_file(buffer, batch_size=1)
+
+        return buffer.getvalue()
+
+    assert asyncio.run(main())
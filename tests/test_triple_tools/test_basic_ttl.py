@@ -458,3 +458,140 @@ def test_bnode_ttl(param):
 def test_fail_ttl(invalid_object):
     with pytest.raises(TypeError):
         list(ttl(URIRef("urn:s"), (URIRef("urn:p"), invalid_object)))
+
+
+def _relabel_bnodes(triples):
+    """Replace blank nodes with integers in order of first appearance."""
+    labels: dict[BNode, int] = {}
+
+    def _label(term):
+        if isinstance(term, BNode):
+            return labels.setdefault(term, len(labels))
+        return term
+
+    return [tuple(map(_label, triple)) for triple in triples]
+
+
+@pytest.mark.parametrize("param", bnode_params)
+def test_bnode_ttl_order(param):
+    """Check that triples involving blank nodes are generated in document order."""
+    triples = ttl(param.s, *param.po)
+    assert _relabel_bnodes(triples) == _relabel_bnodes(param.expected)
+
+
+def test_long_collection_ttl():
+    """Check that collection length is not bounded by the recursion limit."""
+    n = 50_000
+    triples = list(ttl(ex.s, (ex.p, tuple(map(str, range(n))))))
+
+    assert len(triples) == 2 * n + 1
+    assert triples[1][2] == Literal("0")
+    assert triples[-1][1:] == (RDF.rest, RDF.nil)
+    assert triples[-2][1:] == (RDF.first, Literal(str(n - 1)))
+
+
+def test_deep_nesting_ttl():
+    """Check that nesting depth is not bounded by the recursion limit."""
+    depth = 10_000
+    obj: list = [(ex.p, "leaf")]
+
+    for _ in range(depth):
+        obj = [(ex.p, obj)]
+
+    triples = list(ttl(ex.s, (ex.p, obj)))
+
+    assert len(triples) == depth + 2
+    assert triples[-1][1:] == (ex.p, Literal("leaf"))
+
+
+def test_empty_collection_ttl():
+    with pytest.raises(ValueError):
+        list(ttl(ex.s, (ex.p, ())))
+
+
+@pytest.mark.parametrize("param", bnode_params)
+def test_skolemized_ttl(param):
+    """Check that skolemized ttl objects generate isomorphic and deterministic triples."""
+    triples = list(ttl(param.s, *param.po, skolemize=True))
+
+    assert triples == list(ttl(param.s, *param.po, skolemize=True))
+    assert _relabel_bnodes(triples) == _relabel_bnodes(param.expected)
+
+
+def test_skolemized_ttl_bnode_subject():
+    """Check that [] subjects of skolemized ttl objects are derived from their content."""
+    t1 = ttl([], (ex.p, "1"), (ex.p2, [(ex.p3, "2")]), skolemize=True)
+    t2 = ttl([], (ex.p2, [(ex.p3, "2")]), (ex.p, "1"), skolemize=True)
+    t3 = ttl([], (ex.p, "2"), (ex.p2, [(ex.p3, "2")]), skolemize=True)
+
+    assert t1.subject == t2.subject
+    assert t1.subject != t3.subject
+    assert t1.subject == ttl(
+        ex.s, (ex.p, [(ex.p, "1"), (ex.p2, [(ex.p3, "2")])]), skolemize=True
+    ).to_graph().value(ex.s, ex.p)
+
+
+def test_skolemized_ttl_collapse():
+    """Check that identical blank node structures collapse to a single blank node."""
+    triples = ttl(
+        ex.s,
+        (ex.p, [(ex.p2, "1")], [(ex.p2, "1")], ("1", "2"), ("1", "2")),
+        (ex.p3, [(ex.p2, "1")]),
+        skolemize=True,
+    )
+    graph = triples.to_graph()
+
+    assert len(set(graph.objects(ex.s, ex.p))) == 2
+    assert set(graph.objects(ex.s, ex.p3)) < set(graph.objects(ex.s, ex.p))
+    assert len(graph) == 8
+
+
+def test_skolemized_nested_ttl():
+    """Check that a skolemized nested ttl object is deterministic in a non-skolemized parent."""
+    triples = ttl(ex.s, (ex.p, ttl(ex.o, (ex.q, [(ex.r, "1")]), skolemize=True)))
+
+    assert list(triples) == list(triples)
+
+
+def test_non_skolemized_nested_ttl():
+    """Check that a non-skolemized nested ttl object mints random blank nodes in a skolemized parent."""
+    triples = ttl(
+        ex.s,
+        (ex.p, ttl(ex.o, (ex.q, [(ex.r, "1")]))),
+        (ex.p2, [(ex.r, "1")]),
+        skolemize=True,
+    )
+    graph_1, graph_2 = triples.to_graph(), triples.to_graph()
+
+    assert graph_1.value(ex.s, ex.p2) == graph_2.value(ex.s, ex.p2)
+    assert graph_1.value(ex.o, ex.q) != graph_2.value(ex.o, ex.q)
+    assert graph_1.value(ex.o, ex.q) != graph_1.value(ex.s, ex.p2)
+
+
+def test_skolemized_ttl_long_collection():
+    n = 50_000
+    triples = list(ttl(ex.s, (ex.p, tuple(map(str, range(n)))), skolemize=True))
+
+    assert len(triples) == 2 * n + 1
+    assert len({s for s, *_ in triples}) == n + 1
+
+
+@pytest.mark.parametrize("param", [*params, *bnode_params])
+def test_frozen_ttl(param):
+    """Check that frozen ttl objects are stable across iterations."""
+    triples = ttl(param.s, *param.po)
+    frozen = triples.frozen()
+
+    assert list(frozen) == list(frozen)
+    assert len(frozen) == len(param.expected)
+    assert frozen.frozen() is frozen
+    assert _relabel_bnodes(frozen) == _relabel_bnodes(param.expected)
+
+
+def test_frozen_ttl_nested():
+    """Check that nested frozen ttl objects yield their cached triples."""
+    frozen = ttl([], (ex.p, [(ex.p2, "1")])).frozen()
+    triples = list(ttl(ex.s, (ex.p, frozen)))
+
+    assert frozen.subject == list(frozen)[0][0]
+    assert triples == [(ex.s, ex.p, frozen.subject), *frozen]
@@ -0,0 +1,56 @@
+"""Pytest entry point for lodkit triple deduplication tests."""
+
+import pytest
+from rdflib import XSD, Literal, Namespace
+
+from lodkit import TripleChain, ttl
+from lodkit.triple_tools.dedup import BloomFilter
+
+ex = Namespace("https://example.com/")
+
+t1 = ttl(ex.s, (ex.p, ex.o, "1", Literal("1", lang="en")))
+t2 = ttl(ex.s, (ex.p, ex.o, Literal("1", datatype=XSD.string), "2"))
+
+
+@pytest.mark.parametrize("mode", ["exact", "approximate"])
+def test_triple_chain_unique(mode):
+    chain = TripleChain(t1, t2, t1).unique(mode=mode)
+    expected = list(dict.fromkeys([*t1, *t2]))
+
+    assert list(chain) == expected
+    assert len(expected) == 5
+
+
+def test_triple_chain_unique_chain():
+    chain = TripleChain(t1, t1).unique().chain(t1, t2).unique()
+    assert len(list(chain)) == 5
+
+
+def test_triple_chain_unique_invalid_mode():
+    with pytest.raises(ValueError):
+        list(TripleChain(t1).unique(mode="dne"))
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"capacity": 0}, {"capacity": -1}, {"error_rate": 0}, {"error_rate": 1}]
+)
+def test_triple_chain_unique_invalid_bloom_filter(kwargs):
+    with pytest.raises(ValueError):
+        list(TripleChain(t1).unique(mode="approximate", **kwargs))
+
+
+def test_bloom_filter_error_rate():
+    """Check that the false positive rate stays close to the configured error rate."""
+    capacity, error_rate = 10_000, 0.01
+    bloom_filter = BloomFilter(capacity, error_rate)
+
+    assert not any(bloom_filter.add(f"item {i}".encode()) for i in range(1_000))
+    assert all(f"item {i}".encode() in bloom_filter for i in range(1_000))
+
+    for i in range(1_000, capacity):
+        bloom_filter.add(f"item {i}".encode())
+
+    false_positives = sum(
+        f"other {i}".encode() in bloom_filter for i in range(capacity)
+    )
+    assert false_positives / capacity < 2 * error_rate
@@ -0,0 +1,125 @@
+"""Pytest entry point for lodkit external sort tests."""
+
+import io
+
+import pytest
+from rdflib import XSD, BNode, Literal, Namespace
+
+from lodkit import TripleChain, ttl
+from lodkit.triple_tools.dedup import _encode
+from lodkit.triple_tools import external_sort
+from lodkit.triple_tools.external_sort import sorted_unique
+
+ex = Namespace("https://example.com/")
+
+triples = ttl(
+    ex.s,
+    (ex.p3, ex.o, "2", "1", Literal("1", lang="en")),
+    (ex.p, [(ex.p2, "3")], ex.o2),
+    (ex.p2, ("1", "2")),
+).frozen()
+
+
+@pytest.mark.parametrize("run_size", [1, 2, 3, 1_000])
+def test_sorted_unique(run_size, tmp_path):
+    """Check that sorted_unique yields distinct triples in N-Triples order."""
+    chain = TripleChain(triples, triples, reversed(triples.triples)).sorted_unique(
+        run_size=run_size, directory=tmp_path
+    )
+    result = list(chain)
+
+    assert result == sorted(triples, key=_encode)
+    assert not list(tmp_path.iterdir())
+
+
+def test_sorted_unique_duplicates_in_first_run(tmp_path):
+    """Check that duplicates in the first run do not truncate the stream."""
+    objects = [ex.o1, ex.o1, *(ex[f"o{i}"] for i in range(2, 7))]
+    chain = TripleChain((ex.s, ex.p, o) for o in objects).sorted_unique(
+        run_size=4, directory=tmp_path
+    )
+
+    result = list(chain)
+
+    assert len(result) == 6
+    assert result == sorted({(ex.s, ex.p, o) for o in objects}, key=_encode)
+
+
+@pytest.mark.parametrize("max_open_runs", [2, 3])
+def test_sorted_unique_multi_pass_merge(max_open_runs, tmp_path, monkeypatch):
+    """Check that runs are merged in several passes with a bounded number of open runs."""
+    open_runs = 0
+    max_open = 0
+    _read_run = external_sort._read_run
+
+    def _counting_read_run(path):
+        nonlocal open_runs, max_open
+        open_runs += 1
+        max_open = max(max_open, open_runs)
+        try:
+            yield from _read_run(path)
+        finally:
+            open_runs -= 1
+
+    monkeypatch.setattr(external_sort, "_read_run", _counting_read_run)
+
+    chain = TripleChain(triples, triples, reversed(triples.triples)).sorted_unique(
+        run_size=1, directory=tmp_path, max_open_runs=max_open_runs
+    )
+
+    assert list(chain) == sorted(triples, key=_encode)
+    assert max_open <= max_open_runs
+    assert not list(tmp_path.iterdir())
+
+
+def test_sorted_unique_term_roundtrip(tmp_path):
+    """Check that spilled triples are decoded to the original terms."""
+    bnode = BNode()
+    terms = ttl(
+        bnode,
+        (
+            ex.p,
+            'quote " and \\ backslash',
+            "new\nline\r",
+            Literal("1", lang="de-AT"),
+            Literal("01", datatype=XSD.integer, normalize=False),
+            Literal(1.5),
+            Literal("ü ∀"),
+            ex["ü"],
+            BNode("b 1"),
+        ),
+    ).frozen()
+    result = list(sorted_unique(terms, run_size=1, directory=tmp_path))
+
+    assert result == sorted(terms, key=_encode)
+    assert all(
+        type(term) is type(expected)
+        for triple, expected_triple in zip(result, sorted(terms, key=_encode))
+        for term, expected in zip(triple, expected_triple)
+    )
+
+
+def test_sorted_unique_invalid_max_open_runs():
+    with pytest.raises(ValueError):
+        list(sorted_unique(triples, run_size=1, max_open_runs=1))
+
+
+def test_sorted_unique_to_file():
+    """Check that sorted_unique produces sorted N-Triples files."""
+    buffer = io.BytesIO()
+    TripleChain(triples).sorted_unique(run_size=2).to_file(buffer)
+    lines = buffer.getvalue().splitlines()
+
+    assert lines == sorted(set(lines))
+    assert len(lines) == len(triples)
+
+
+def test_sorted_unique_cleanup(tmp_path):
+    """Check that temporary runs are removed if the stream is closed early."""
+    stream = sorted_unique(triples, run_size=1, directory=tmp_path)
+    next(stream)
+
+    assert list(tmp_path.iterdir())
+
+    stream.close()
+    assert not list(tmp_path.iterdir())
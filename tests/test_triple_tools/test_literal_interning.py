@@ -0,0 +1,59 @@
+"""Pytest entry point for lodkit Literal interning tests."""
+
+import pytest
+from rdflib import Literal, Namespace
+
+from lodkit import (
+    Placeholder,
+    TTLTemplate,
+    disable_literal_interning,
+    enable_literal_interning,
+    literal_cache_info,
+    ttl,
+)
+
+ex = Namespace("https://example.com/")
+
+
+@pytest.fixture(scope="function")
+def literal_interning():
+    enable_literal_interning(maxsize=8)
+
+    try:
+        yield
+    finally:
+        disable_literal_interning()
+
+
+def test_literal_interning_disabled():
+    (*_, o1), (*_, o2) = ttl(ex.s, (ex.p, "1", "1"))
+
+    assert literal_cache_info() is None
+    assert o1 == o2 and o1 is not o2
+
+
+def test_literal_interning(literal_interning):
+    """Check that repeated str values resolve to the same Literal across ttl objects."""
+    (*_, o1), (*_, o2) = ttl(ex.s, (ex.p, "1", "1"))
+    ((*_, o3),) = ttl(ex.s2, (ex.p, "1"))
+
+    assert o1 is o2 is o3
+    assert o1 == Literal("1")
+
+    cache_info = literal_cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.maxsize) == (2, 1, 8)
+
+
+def test_literal_interning_bounded(literal_interning):
+    list(ttl(ex.s, (ex.p, *map(str, range(100)))))
+
+    assert literal_cache_info().currsize == 8
+
+
+def test_literal_interning_template(literal_interning):
+    template = TTLTemplate(ex.s, (ex.p, Placeholder("value"), "constant"))
+    (*_, o1), (*_, c1), (*_, o2), (*_, c2) = template.bind([("1",), ("1",)])
+    ((*_, o3),) = ttl(ex.s, (ex.p, "1"))
+
+    assert o1 is o2 is o3
+    assert c1 is c2
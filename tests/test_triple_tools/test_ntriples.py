@@ -0,0 +1,61 @@
+"""Pytest entry point for lodkit N-Triples/N-Quads streaming tests."""
+
+import io
+
+import pytest
+from rdflib import XSD, Dataset, Graph, Literal, Namespace
+from rdflib.compare import isomorphic
+
+from lodkit import TripleChain, ttl
+from lodkit.triple_tools.ntriples import serialize_stream
+
+ex = Namespace("https://example.com/")
+
+triples = ttl(
+    ex.s,
+    (ex.p, ex.o, "literal", Literal("literal", lang="en")),
+    (ex.p2, Literal(1), Literal("2", datatype=XSD.decimal)),
+    (ex.p3, 'multi\nline "quoted" \\ literal\r', "unicode: äöü ✓"),
+    (ex.p4, [(ex.p5, ex.o)], ("1", "2")),
+)
+
+
+def test_serialize_stream_roundtrip():
+    """Check that streamed N-Triples parse into a graph isomorphic to to_graph."""
+    buffer = io.BytesIO()
+    count = serialize_stream(triples, buffer, batch_size=3)
+
+    graph = Graph().parse(data=buffer.getvalue(), format="nt")
+
+    assert count == len(list(triples))
+    assert isomorphic(graph, triples.to_graph())
+
+
+def test_serialize_stream_nquads():
+    """Check that providing a graph name writes N-Quads for that named graph."""
+    buffer = io.BytesIO()
+    serialize_stream(triples, buffer, graph_name=ex.graph)
+
+    dataset = Dataset().parse(data=buffer.getvalue(), format="nquads")
+
+    assert isomorphic(dataset.graph(ex.graph), triples.to_graph())
+
+
+def test_to_file_path(tmp_path):
+    path = tmp_path / "triples.nt"
+    count = TripleChain(triples).to_file(path)
+
+    graph = Graph().parse(path, format="nt")
+
+    assert count == len(graph)
+    assert isomorphic(graph, triples.to_graph())
+
+
+def test_to_file_exhaustion(tmp_path):
+    chain = TripleChain(triples)
+
+    assert chain.to_file(tmp_path / "triples.nt")
+
+    msg = "No triples written to '.+'. This might indicate an exhausted iterator."
+    with pytest.warns(UserWarning, match=msg):
+        assert not chain.to_file(tmp_path / "empty.nt")
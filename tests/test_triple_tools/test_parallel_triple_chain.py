@@ -0,0 +1,62 @@
+"""Pytest entry point for lodkit.ParallelTripleChain tests."""
+
+import functools
+
+import pytest
+from rdflib import Namespace
+from rdflib.compare import isomorphic
+
+from lodkit import ParallelTripleChain, TripleChain, ttl
+
+ex = Namespace("https://example.com/")
+
+pairs = [(ex[f"p{i}"], ex[f"o{i}"], str(i), [(ex.p, str(i))]) for i in range(20)]
+
+
+def generate_sources():
+    return [functools.partial(ttl, ex.s, pair, skolemize=True) for pair in pairs]
+
+
+@pytest.mark.parametrize("max_pending", [None, 1, 3])
+def test_parallel_triple_chain_ordered(max_pending):
+    """Check that ordered parallel chains yield triples in source order."""
+    chain = ParallelTripleChain(
+        *generate_sources(), max_workers=2, max_pending=max_pending
+    )
+    expected = TripleChain(*(source() for source in generate_sources()))
+
+    assert list(chain) == list(expected)
+
+
+def test_parallel_triple_chain_unordered():
+    chain = ParallelTripleChain(*generate_sources(), max_workers=2, ordered=False)
+    graph = ttl(ex.s, *pairs).to_graph()
+
+    assert len(chain.to_graph()) == len(graph)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_parallel_triple_chain_from_partitions(chunk_size):
+    chain = ParallelTripleChain.from_partitions(
+        functools.partial(ttl, ex.s), pairs, chunk_size=chunk_size, max_workers=2
+    )
+
+    assert isomorphic(chain.to_graph(), ttl(ex.s, *pairs, skolemize=True).to_graph())
+
+
+def test_parallel_triple_chain_chain():
+    chain = ParallelTripleChain(*generate_sources(), max_workers=2).chain(
+        ttl(ex.s2, (ex.p, ex.o))
+    )
+
+    assert type(chain) is TripleChain
+    assert list(chain)[-1] == (ex.s2, ex.p, ex.o)
+
+
+def test_parallel_triple_chain_exhaustion():
+    chain = ParallelTripleChain(*generate_sources(), max_workers=2)
+
+    assert chain.to_graph()
+
+    with pytest.warns(UserWarning):
+        chain.to_graph()
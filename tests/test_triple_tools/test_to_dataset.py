@@ -0,0 +1,77 @@
+"""Pytest entry point for lodkit to_dataset tests."""
+
+import io
+
+import pytest
+from rdflib import Dataset, Graph, Literal, Namespace
+from rdflib.compare import isomorphic
+
+from lodkit import TripleChain, ttl
+
+ex = Namespace("https://example.com/")
+
+
+def test_ttl_to_dataset_graph_name():
+    """Check that ttl.to_dataset adds triples to the named graph of the ttl object."""
+    triples = ttl(ex.s, (ex.p, "1", [(ex.p2, ex.o)]), graph_name=ex.graph)
+    dataset = triples.to_dataset()
+
+    assert isomorphic(dataset.graph(ex.graph), triples.to_graph())
+    assert not len(dataset.default_graph)
+
+
+def test_ttl_quads():
+    triples = ttl(ex.s, (ex.p, "1", "2"), graph_name=ex.graph)
+
+    assert list(triples.quads()) == [(*triple, ex.graph) for triple in triples]
+    assert triples.frozen().graph_name == ex.graph
+
+
+def test_ttl_to_file_graph_name():
+    """Check that ttl.to_file writes N-Quads for the graph_name of the ttl object."""
+    triples = ttl(ex.s, (ex.p, "1"), graph_name=ex.graph)
+    buffer, override = io.BytesIO(), io.BytesIO()
+
+    triples.to_file(buffer)
+    triples.to_file(override, graph_name=ex.other)
+
+    assert buffer.getvalue().rstrip().endswith(b'"1" <https://example.com/graph> .')
+    assert buffer.getvalue() == override.getvalue().replace(b"other", b"graph")
+
+
+def test_triple_chain_to_dataset_routing():
+    """Check that quads are routed into their named graphs and triples into graph_name."""
+    chain = TripleChain(
+        *(
+            ttl(ex[f"s{i}"], (ex.p, Literal(i)), graph_name=ex[f"graph{i % 3}"]).quads()
+            for i in range(10)
+        ),
+        ttl(ex.s, (ex.p, ex.o)),
+        [(ex.s, ex.p, ex.o2, None)],
+    )
+    dataset = Dataset()
+    chain.to_dataset(dataset, graph_name=ex.default, batch_size=3)
+
+    for i in range(3):
+        expected = Graph()
+        for j in range(i, 10, 3):
+            expected.add((ex[f"s{j}"], ex.p, Literal(j)))
+
+        assert isomorphic(dataset.graph(ex[f"graph{i}"]), expected)
+
+    assert set(dataset.graph(ex.default)) == {(ex.s, ex.p, ex.o)}
+    assert set(dataset.default_graph) == {(ex.s, ex.p, ex.o2)}
+
+
+def test_to_dataset_invalid_term():
+    with pytest.raises(TypeError):
+        TripleChain([(ex.s, ex.p, "literal", ex.graph)]).to_dataset()
+
+
+def test_to_dataset_exhaustion():
+    chain = TripleChain(ttl(ex.s, (ex.p, ex.o)))
+    chain.to_dataset()
+
+    msg = "No statements added to Dataset object .+ This might indicate an exhausted iterator."
+    with pytest.warns(UserWarning, match=msg):
+        chain.to_dataset()
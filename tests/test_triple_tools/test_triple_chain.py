@@ -1,6 +1,10 @@
+import io
+import operator
+
 from lodkit import TripleChain, ttl
+from lodkit.triple_tools.ntriples import NTriplesWriter
 import pytest
-from rdflib import Namespace
+from rdflib import Dataset, Graph, Namespace
 from rdflib.compare import isomorphic
 
 ex = Namespace("https://example.com/")
@@ -55,3 +59,85 @@ def test_basic_triple_chain_exhaustion(chain):
     msg = "Graph object '.+' is empty. This might indicate an exhausted iterator."
     with pytest.warns(UserWarning, match=msg):
         chain.to_graph()
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 10_000])
+@pytest.mark.parametrize("trusted", [True, False])
+def test_triple_chain_to_graph_batched(batch_size, trusted):
+    """Check that batched insertion adds all triples to the graph."""
+    triples = ttl(ex.s, (ex.p, ex.o, "1", "2"), (ex.p2, [(ex.p3, ex.o)]))
+    chain = TripleChain(t1, t2, t3, triples)
+    graph = chain.to_graph(batch_size=batch_size, trusted=trusted)
+
+    assert len(graph) == 7
+
+
+def test_triple_chain_to_graph_no_len(monkeypatch):
+    """Check that to_graph does not count the graph after adding triples."""
+
+    def _len(self):
+        raise AssertionError("len called")
+
+    graph = Graph()
+    monkeypatch.setattr(Graph, "__len__", _len)
+
+    assert TripleChain(t1, t2, t3).to_graph(graph) is graph
+
+
+def test_triple_chain_to_graph_dataset():
+    """Check that triples are added to the default graph of a Dataset."""
+    dataset = TripleChain(t1, t2, t3).to_graph(graph=Dataset())
+
+    assert len(dataset.default_graph) == 3
+
+
+def test_triple_chain_to_graph_invalid():
+    with pytest.raises(TypeError):
+        TripleChain(t1, [(ex.s, ex.p, 1)]).to_graph()
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 10_000])
+def test_triple_chain_fan_out(batch_size):
+    """Check that fan_out passes the same batches to all sinks in a single pass."""
+    buffer = io.BytesIO()
+    graph, batches = Graph(), []
+    chain = TripleChain(t1, t2, t3)
+
+    with NTriplesWriter(buffer) as writer:
+        count = chain.fan_out(graph, writer, batches.append, batch_size=batch_size)
+
+    expected = TripleChain(t1, t2, t3).to_graph()
+
+    assert count == 3
+    assert isomorphic(graph, expected)
+    assert isomorphic(Graph().parse(data=buffer.getvalue(), format="nt"), expected)
+    assert [triple for batch in batches for triple in batch] == [*t1, *t2, *t3]
+
+
+def test_triple_chain_fan_out_identity():
+    """Check that all sinks receive identical batch and triple objects."""
+    batches_1, batches_2 = [], []
+    TripleChain(t1, t2, t3).fan_out(batches_1.append, batches_2.append, batch_size=2)
+
+    assert all(map(operator.is_, batches_1, batches_2))
+
+
+def test_triple_chain_fan_out_errors():
+    with pytest.raises(TypeError):
+        TripleChain(t1).fan_out(object())
+
+    with pytest.warns(UserWarning):
+        TripleChain().fan_out(Graph())
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4])
+def test_triple_chain_batched(n):
+    triples = [*t1, *t2, *t3]
+    batches = list(TripleChain(t1, t2, t3).batched(n))
+
+    assert all(len(batch) == n for batch in batches[:-1])
+    assert [triple for batch in batches for triple in batch] == triples
+    assert (
+        list(ttl(ex.s, (ex.p, ex.o), (ex.p2, ex.o2), (ex.p3, ex.o3)).batched(n))
+        == batches
+    )
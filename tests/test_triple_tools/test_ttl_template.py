@@ -0,0 +1,159 @@
+"""Pytest entry point for lodkit.TTLTemplate tests."""
+
+import pytest
+from rdflib import BNode, Literal, Namespace, URIRef
+
+from lodkit import Placeholder, TTLTemplate, URIConstructor, ttl
+
+ex = Namespace("https://example.com/")
+
+records = [
+    {"id": ex.s1, "name": "name 1", "code": "a"},
+    {"id": ex.s2, "name": Literal("name 2", lang="en"), "code": "b"},
+]
+
+
+def _relabel_bnodes(triples):
+    """Replace blank nodes with integers in order of first appearance."""
+    labels: dict[BNode, int] = {}
+
+    def _label(term):
+        if isinstance(term, BNode):
+            return labels.setdefault(term, len(labels))
+        return term
+
+    return [tuple(map(_label, triple)) for triple in triples]
+
+
+def _shape(subject, name, code):
+    """Define the same shape for ttl and TTLTemplate."""
+    return (
+        subject,
+        (ex.name, name, "constant"),
+        (ex.code, [(ex.value, code), (ex.list, (code, name))]),
+        (ex.ref, ttl(ex.ref, (ex.name, name))),
+    )
+
+
+def test_template_bind_ttl_equivalence():
+    """Check that binding a template generates the same triples as ttl."""
+    template = TTLTemplate(
+        *_shape(Placeholder("id"), Placeholder("name"), Placeholder("code"))
+    )
+
+    expected = [
+        triple
+        for record in records
+        for triple in ttl(*_shape(record["id"], record["name"], record["code"]))
+    ]
+
+    assert _relabel_bnodes(template.bind(records)) == _relabel_bnodes(expected)
+
+
+def test_template_bind_sequence_records():
+    """Check that sequence records are bound by field position."""
+    template = TTLTemplate(
+        Placeholder("id"), (ex.name, Placeholder("name")), fields=("name", "id")
+    )
+
+    assert list(template.bind([("name 1", ex.s1), ("name 2", ex.s2)])) == [
+        (ex.s1, ex.name, Literal("name 1")),
+        (ex.s2, ex.name, Literal("name 2")),
+    ]
+
+
+def test_template_bnodes_per_record():
+    """Check that blank nodes are minted per record."""
+    template = TTLTemplate([], (ex.name, Placeholder("name")))
+    (s1, *_), (s2, *_) = template.bind([("1",), ("2",)])
+
+    assert isinstance(s1, BNode)
+    assert s1 != s2
+
+
+def test_template_converter():
+    make_uri = URIConstructor("https://example.com/")
+    template = TTLTemplate(
+        Placeholder("id", converter=make_uri), (ex.value, Placeholder("id", make_uri))
+    )
+
+    assert list(template.bind([{"id": "1"}])) == [
+        (make_uri("1"), ex.value, make_uri("1"))
+    ]
+
+
+def test_template_to_graph():
+    template = TTLTemplate(Placeholder("id"), (ex.name, Placeholder("name")))
+    graph = template.bind(records).to_graph()
+
+    assert len(graph) == 2
+
+
+@pytest.mark.parametrize("invalid_value", [1, None, Literal("subject")])
+def test_template_bind_invalid_subject(invalid_value):
+    template = TTLTemplate(Placeholder("id"), (ex.p, ex.o))
+
+    with pytest.raises(TypeError):
+        list(template.bind([(invalid_value,)]))
+
+
+@pytest.mark.parametrize("invalid_value", [1, None, type("Foo", (), {})])
+def test_template_bind_invalid_object(invalid_value):
+    template = TTLTemplate(ex.s, (ex.p, Placeholder("value")))
+
+    with pytest.raises(TypeError):
+        list(template.bind([(invalid_value,)]))
+
+
+def test_template_compile_errors():
+    with pytest.raises(TypeError):
+        TTLTemplate(ex.s, ("predicate", ex.o))
+
+    with pytest.raises(TypeError):
+        TTLTemplate(ex.s, (ex.p, 1))
+
+    with pytest.raises(ValueError):
+        TTLTemplate(Placeholder("id"), (ex.p, ex.o), fields=())
+
+    with pytest.raises(ValueError):
+        TTLTemplate(Placeholder("id"), (ex.p, Placeholder("id", converter=URIRef)))
+
+
+def test_template_nested_bnode_ttl_per_record():
+    """Check that nested ttl([]) subjects are minted per record."""
+    template = TTLTemplate(
+        Placeholder("id"), (ex.address, ttl([], (ex.city, Placeholder("city"))))
+    )
+    triples = list(template.bind([(ex.s1, "a"), (ex.s2, "b")]))
+    (_, _, address_1), (node_1, _, _), (_, _, address_2), (node_2, _, _) = triples
+
+    assert address_1 == node_1
+    assert address_2 == node_2
+    assert address_1 != address_2
+
+
+def test_template_bnode_terms_per_record():
+    """Check that BNode terms are minted per record and shared within a record."""
+    bnode = BNode()
+    template = TTLTemplate(
+        Placeholder("id"),
+        (ex.ref, bnode),
+        (ex.other, ttl(bnode, (ex.name, Placeholder("name")))),
+    )
+    (
+        (_, _, ref_1),
+        (_, _, other_1),
+        (subject_1, _, _),
+        (_, _, ref_2),
+        *_,
+    ) = template.bind([(ex.s1, "a"), (ex.s2, "b")])
+
+    assert ref_1 == other_1 == subject_1
+    assert bnode not in (ref_1, ref_2)
+    assert ref_1 != ref_2
+
+
+def test_template_empty_tuple_subject():
+    """Check that an empty tuple is not accepted as [] subject."""
+    with pytest.raises(TypeError):
+        TTLTemplate((), (ex.name, Placeholder("name")))
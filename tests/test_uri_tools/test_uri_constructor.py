@@ -1,5 +1,12 @@
 """Pytest entry point for basic lodkit.URIConstructor tests."""
 
+import base64
+import hashlib
+from uuid import UUID
+
+import pytest
+from rdflib import URIRef
+
 from lodkit import URIConstructor
 
 
@@ -8,3 +15,187 @@ def test_uri_constructor_basic():
 
     assert make_uri() != make_uri()
     assert make_uri("test") == make_uri("test")
+
+
+def test_uri_constructor_many():
+    make_uri = URIConstructor("https://example.com/")
+    values = [f"value{i}" for i in range(100)] + [b"bytes"]
+
+    assert list(make_uri.many(values)) == [make_uri(value) for value in values]
+    assert list(make_uri.many(values, max_workers=2, chunk_size=7)) == [
+        make_uri(value) for value in values
+    ]
+
+
+def test_uri_constructor_many_unique():
+    make_uri = URIConstructor("https://example.com/")
+    uris = list(make_uri.many([None] * 10, max_workers=2, chunk_size=3))
+
+    assert len(set(uris)) == 10
+    assert all(uri.startswith("https://example.com/") for uri in uris)
+
+
+def test_uri_constructor_cache():
+    make_uri = URIConstructor("https://example.com/", cache_size=2)
+
+    assert make_uri("a") == URIConstructor("https://example.com/")("a")
+    assert make_uri("a") is make_uri("a")
+
+    make_uri("b")
+    make_uri("c")  # evicts "a"
+    make_uri("a")
+
+    assert make_uri.cache_info() == (2, 4, 2, 2)
+
+
+def test_uri_constructor_cache_disabled():
+    with pytest.raises(ValueError):
+        URIConstructor("https://example.com/").cache_info()
+
+
+def test_uri_constructor_cache_warm_persist(tmp_path):
+    path = tmp_path / "uris.json"
+
+    make_uri = URIConstructor("https://example.com/", cache_size=10)
+    make_uri.warm(["a", b"b"])
+    make_uri.dump_cache(path)
+
+    assert make_uri.cache_info() == (0, 0, 10, 2)
+
+    reloaded = URIConstructor("https://example.com/", cache_size=10)
+    reloaded.load_cache(path)
+
+    assert [reloaded("a"), reloaded(b"b")] == [make_uri("a"), make_uri(b"b")]
+    assert reloaded.cache_info() == (2, 0, 10, 2)
+
+    with pytest.raises(ValueError):
+        URIConstructor("https://example.org/", cache_size=10).load_cache(path)
+
+
+@pytest.mark.parametrize(
+    ["kwargs", "segment"],
+    [
+        ({}, hashlib.sha256(b"test").hexdigest()),
+        ({"length": 16}, hashlib.sha256(b"test").hexdigest()[:16]),
+        ({"length": 64}, hashlib.sha256(b"test").hexdigest()),
+        (
+            {"digest": "blake2b", "digest_size": 16},
+            hashlib.blake2b(b"test", digest_size=16).hexdigest(),
+        ),
+        (
+            {"digest": "blake2b", "digest_size": 8, "encoding": "base32"},
+            base64.b32encode(hashlib.blake2b(b"test", digest_size=8).digest())
+            .decode()
+            .rstrip("=")
+            .lower(),
+        ),
+        (
+            {"encoding": "base64url", "length": 22},
+            base64.urlsafe_b64encode(hashlib.sha256(b"test").digest()).decode()[:22],
+        ),
+        (
+            {"digest": "shake_128", "digest_size": 10},
+            hashlib.shake_128(b"test").hexdigest(10),
+        ),
+    ],
+)
+def test_uri_constructor_digest(kwargs, segment):
+    make_uri = URIConstructor("https://example.com/", **kwargs)
+
+    assert make_uri("test") == URIRef(f"https://example.com/{segment}")
+    assert list(make_uri.many(["test", b"test"])) == [make_uri("test")] * 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"digest": "unknown"},
+        {"encoding": "base85"},
+        {"digest_size": 16},
+        {"digest": "shake_128", "digest_size": 0},
+        {"digest": "shake_128", "digest_size": -1},
+        {"length": 0},
+        {"length": -1},
+        {"length": 65},
+        {"encoding": "base64url", "length": 44},
+    ],
+)
+def test_uri_constructor_digest_invalid(kwargs):
+    with pytest.raises(ValueError):
+        URIConstructor("https://example.com/", **kwargs)
+
+
+def test_uri_constructor_fallback_uuid7():
+    make_uri = URIConstructor("https://example.com/", fallback="uuid7")
+    uris = [make_uri() for _ in range(10_000)]
+
+    assert uris == sorted(uris)
+    assert len(set(uris)) == len(uris)
+    assert UUID(uris[0].removeprefix("https://example.com/")).version == 7
+
+
+def test_uri_constructor_fallback_counter():
+    make_uri = URIConstructor(
+        "https://example.com/counter/", fallback="counter", fallback_prefix="worker1"
+    )
+
+    assert list(make_uri.many([None, "test", None])) == [
+        URIRef("https://example.com/counter/worker1-0000000000000000"),
+        URIConstructor("https://example.com/counter/")("test"),
+        URIRef("https://example.com/counter/worker1-0000000000000001"),
+    ]
+
+
+def test_uri_constructor_fallback_counter_shared():
+    """Check that counters are shared per namespace and fallback_prefix."""
+    namespace = "https://example.com/shared/"
+    make_uri_1 = URIConstructor(namespace, fallback="counter")
+    make_uri_2 = URIConstructor(namespace, fallback="counter")
+    make_uri_3 = URIConstructor(namespace, fallback="counter", fallback_prefix="w")
+
+    uris = [make_uri_1(), make_uri_2(), make_uri_1(), make_uri_3()]
+
+    assert len(set(uris)) == 4
+    assert uris[:3] == sorted(uris[:3])
+    assert uris[3] == URIRef(f"{namespace}w-0000000000000000")
+
+
+def test_uri_constructor_fallback_start():
+    """Check that fallback_start resumes a counter sequence."""
+    namespace = "https://example.com/resumed/"
+    make_uri = URIConstructor(namespace, fallback="counter", fallback_start=42)
+
+    assert make_uri() == URIRef(f"{namespace}{42:016x}")
+
+    # starts never rewind a shared counter
+    URIConstructor(namespace, fallback="counter", fallback_start=0)
+    assert make_uri() == URIRef(f"{namespace}{43:016x}")
+
+
+@pytest.mark.parametrize("fallback", ["uuid7", "counter"])
+def test_uri_constructor_many_ordered_fallback(fallback):
+    """Check that ordered fallback components follow the output order of many."""
+    make_uri = URIConstructor(
+        f"https://example.com/many/{fallback}/", fallback=fallback
+    )
+    uris = list(make_uri.many([None] * 5_000, max_workers=4, chunk_size=100))
+
+    assert uris == sorted(uris)
+    assert len(set(uris)) == len(uris)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"fallback": "counter", "fallback_start": -1},
+        {"fallback": "uuid4", "fallback_start": 1},
+    ],
+)
+def test_uri_constructor_fallback_start_invalid(kwargs):
+    with pytest.raises(ValueError):
+        URIConstructor("https://example.com/", **kwargs)
+
+
+def test_uri_constructor_fallback_invalid():
+    with pytest.raises(ValueError):
+        URIConstructor("https://example.com/", fallback="uuid1")